@@ -0,0 +1,104 @@
+"""
+Delta animation player for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Plays files made by tools/anim_to_lcd.py straight from flash. A frame holds
+only the runs of page bytes that changed since the previous one, and each
+run is sent to the panel as it is read, so memory use is one run buffer
+whatever the length of the animation. FrameBuffer is not touched.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+anim = Animation( lcd, "loader.lcda" )
+anim.play( loops = 3 )
+anim.close()
+"""
+from time import ticks_ms, ticks_add, ticks_diff, sleep_ms
+
+LCD_WIDTH   = const(192)
+HEADER_SIZE = const(12)
+
+class Animation:
+    def __init__( self, lcd, source ):
+        """ Animation constructor
+        Args
+        lcd    (LCD19264): Display
+        source (string or stream): Filename or open file made by anim_to_lcd.py
+        """
+        self.lcd = lcd
+        self._file = open(source, 'rb') if isinstance(source, str) else source
+        self._own = self._file is not source
+        head = bytearray(HEADER_SIZE)
+        self._file.readinto(head)
+        if head[:4] != b'LCDA':
+            raise ValueError("Not an LCD19264 animation")
+        self.frames = head[4] | (head[5] << 8)
+        self.delay  = head[6] | (head[7] << 8) # ms
+        self._loop  = int.from_bytes(head[8:12], 'little') # Offset of frame 1
+        self._count = bytearray(2)
+        self._run   = bytearray(3)
+        self._data  = memoryview(bytearray(LCD_WIDTH))
+        self.frame  = -1 # Frame on screen, -1 - none yet
+
+    def rewind( self ):
+        """ Start again from the first frame, sent whole """
+        self._file.seek(HEADER_SIZE)
+        self.frame = -1
+
+    def next_frame( self ):
+        """ Send the changes to the next frame to LCD. The first frame
+        follows the last one
+        Return (int): Number of bytes sent
+        """
+        f = self._file
+        count = self._count
+        run = self._run
+        data = self._data
+        write_span = self.lcd._write_span
+        sent = 0
+
+        f.readinto(count)
+        for i in range(count[0] | (count[1] << 8)):
+            f.readinto(run)
+            size = run[2]
+            f.readinto(data[:size])
+            write_span(data, 0, run[0], run[1], size)
+            sent += size
+
+        if self.frame == self.frames - 1: # Looped to the first frame
+            f.seek(self._loop)
+            self.frame = 0
+        else:
+            self.frame += 1
+        return sent
+
+    def play( self, loops = 1 ):
+        """ Play from the current frame at the frame delay of the file.
+        A late frame is not caught up, the next one keeps the delay
+        Args
+        loops (int): Number of times to play all frames, 0 - forever
+        Return (int): Average frames per second achieved
+        """
+        delay = self.delay
+        total = loops * self.frames
+        shown = 0
+        start = deadline = ticks_ms()
+        while loops == 0 or shown < total:
+            self.next_frame()
+            shown += 1
+            if delay:
+                deadline = ticks_add(deadline, delay)
+                wait = ticks_diff(deadline, ticks_ms())
+                if wait > 0:
+                    sleep_ms(wait)
+                else:
+                    deadline = ticks_ms()
+        elapsed = ticks_diff(ticks_ms(), start)
+        return shown * 1000 // elapsed if elapsed else 0
+
+    def close( self ):
+        """ Close the file opened by the constructor """
+        if self._own:
+            self._file.close()
@@ -0,0 +1,78 @@
+"""
+Asset pack loader for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Reads bitmaps from packs made by tools/img_to_assets.py -b. Only the index
+is kept in RAM; a bitmap is read from flash when it is fetched, already in
+the page layout of the FrameBuffer (VLSB), and drawn with draw_vlsb().
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+icons = AssetPack( "icons.pack" )
+icons.draw( lcd, "sun", 0, 0 )
+lcd.show()
+"""
+
+class AssetPack:
+    def __init__( self, filename ):
+        """ AssetPack constructor
+        Args
+        filename (string): Pack made by img_to_assets.py -b
+        """
+        f = open(filename, 'rb')
+        head = f.read(6)
+        if head[:4] != b'LCDP':
+            f.close()
+            raise ValueError("Not an LCD19264 asset pack")
+        self._file = f
+        self._index = {}
+        for i in range(head[4] | (head[5] << 8)):
+            name = f.read(f.read(1)[0]).decode()
+            entry = f.read(8)
+            offset = int.from_bytes(entry[0:4], 'little')
+            self._index[name] = (offset, entry[4] | (entry[5] << 8), entry[6] | (entry[7] << 8))
+
+    def names( self ):
+        """ Return (list): Names of assets """
+        return list(self._index)
+
+    def __contains__( self, name ):
+        return name in self._index
+
+    def size( self, name ):
+        """ Return (tuple): Height and width of an asset """
+        return self._index[name][1:]
+
+    def get( self, name, buffer = None ):
+        """ Read an asset from the pack
+        Args
+        name   (string): Asset name (image file name without extension)
+        buffer (bytearray): Optional buffer to read into, reused between assets
+        Return (tuple): Bitmap data, height, width for LCD19264.draw_vlsb()
+        """
+        offset, height, width = self._index[name]
+        size = width * ((height + 7) >> 3)
+        if buffer is None or len(buffer) < size:
+            data = bytearray(size)
+        else:
+            data = memoryview(buffer)[:size]
+        self._file.seek(offset)
+        self._file.readinto(data)
+        return (data, height, width)
+
+    def draw( self, lcd, name, x, y, color = 1, buffer = None ):
+        """ Read an asset and draw it on FrameBuffer
+        Args
+        lcd    (LCD19264): Display
+        name   (string): Asset name
+        x      (int): Start X position
+        y      (int): Start Y position
+        color  (int): Color 0 or 1
+        buffer (bytearray): Optional buffer to read into
+        """
+        lcd.draw_vlsb(self.get(name, buffer), x, y, color)
+
+    def close( self ):
+        self._file.close()
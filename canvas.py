@@ -0,0 +1,98 @@
+"""
+Virtual canvas for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+A FrameBuffer larger than the screen, for example 576x64 or 192x256,
+rendered once and shown through a 192x64 viewport. The canvas has the
+page layout of the LCD, so show() sends the viewport straight from the
+canvas: a horizontal pan is a column offset of the transfer and a
+vertical pan is a page offset. Nothing is copied, a pan costs only the
+bus transfer.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+canvas = Canvas( lcd, 576, 64 )
+canvas.text( "Page 1", 0, 0, 1 )
+canvas.text( "Page 2", 192, 0, 1 )
+for x in range(0, 385, 4):
+    canvas.pan_to( x, 0 )
+    canvas.show()
+"""
+from framebuf import FrameBuffer, MONO_VLSB
+
+LCD_WIDTH   = const(192)
+LCD_HEIGHT  = const(64)
+LCD_PAGES   = const(8)
+
+class Canvas( FrameBuffer ):
+    def __init__( self, lcd, width, height ):
+        """ Canvas constructor
+        Args
+        lcd    (LCD19264): Display
+        width  (int): Canvas width, at least 192
+        height (int): Canvas height, multiple of 8, at least 64
+        """
+        if width < LCD_WIDTH or height < LCD_HEIGHT or height & 7:
+            raise ValueError( "Canvas must cover the screen, height multiple of 8" )
+        self.lcd = lcd
+        self.width = width
+        self.height = height
+        self.buffer = bytearray( width * (height >> 3) )
+        super().__init__( self.buffer, width, height, MONO_VLSB )
+        self.view_x = 0
+        self.view_y = 0
+
+    def pan_to( self, x, y ):
+        """ Move the viewport, clamped to the canvas
+        Args
+        x (int): Canvas column at the left of the screen
+        y (int): Canvas row at the top of the screen, rounded down to a page
+        Return (bool): True if the viewport moved
+        """
+        x = max(0, min(x, self.width - LCD_WIDTH))
+        y = max(0, min(y, self.height - LCD_HEIGHT)) & ~7
+        if x == self.view_x and y == self.view_y:
+            return False
+        self.view_x = x
+        self.view_y = y
+        return True
+
+    def pan( self, dx, dy ):
+        """ Move the viewport by dx columns and dy rows
+        Return (bool): True if the viewport moved
+        """
+        return self.pan_to(self.view_x + dx, self.view_y + dy)
+
+    def show( self ):
+        """ Send the viewport straight from the canvas to LCD """
+        lcd = self.lcd
+        lcd._select_chip(0) # All chips
+        lcd._set_start(0)
+        width = self.width
+        offset = (self.view_y >> 3) * width + self.view_x
+        for page in range(LCD_PAGES):
+            lcd._write_span(self.buffer, offset, page, 0, LCD_WIDTH)
+            offset += width
+
+    def copy( self ):
+        """ Copy the viewport to FrameBuffer of LCD, to draw over it there """
+        self._copy(self.lcd.buffer, (self.view_y >> 3) * self.width + self.view_x)
+
+    @micropython.viper
+    def _copy( self, dest, offset:int ):
+        """ Copy 8 pages of the canvas to a screen sized buffer
+        Args
+        dest   (buffer): Screen sized VLSB buffer
+        offset (int): Position of the viewport in the canvas
+        """
+        src = ptr8(self.buffer)
+        out = ptr8(dest)
+        width = int(self.width)
+        i = 0
+        for page in range(LCD_PAGES):
+            for x in range(LCD_WIDTH):
+                out[i + x] = src[offset + x]
+            i += LCD_WIDTH
+            offset += width
@@ -0,0 +1,210 @@
+"""
+Text console for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+A terminal on a fixed grid of cells with a cursor, handling newline,
+carriage return, backspace and tab. New lines scroll by moving the start
+line of the controllers, so a scroll sends only the page of the new line.
+write() only draws into the FrameBuffer; flush() sends the pending pages,
+so bursts of writes cost one refresh, optionally limited per call.
+
+The console owns the screen: its FrameBuffer pages form a ring whose top
+page is shown at the top by the start line. Use flush() or show(), not
+LCD19264.show().
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+con = Console( lcd )
+print( "Boot ok", file = con )
+con.write( "Temp: 21.5\\n" )
+while True:
+    con.flush()
+"""
+LCD_WIDTH   = const(192)
+LCD_PAGES   = const(8)
+
+class Console:
+    def __init__( self, lcd, font = None, cursor = True ):
+        """ Console constructor, clears the screen
+        Args
+        lcd    (LCD19264): Display
+        font   (module): Font module from font_to_py.py, None - built-in 8x8 font
+        cursor (bool): Show an underline cursor
+        """
+        self.lcd = lcd
+        self.font = font
+        self.cursor = cursor
+        if font is None:
+            self.cell = 8
+            height = 8
+        else:
+            self.cell = font.max_width()
+            height = font.height()
+        # Pages per line, a divisor of 8 so lines never wrap around the ring
+        lpages = 1
+        while lpages * 8 < height:
+            lpages <<= 1
+        self.line_pages = lpages
+        self.cols = LCD_WIDTH // self.cell
+        self.rows = LCD_PAGES // lpages
+        self.col = 0
+        self.row = 0
+        self._pending = bytearray(2 * LCD_PAGES) # Column span x0, x1 per page
+        self._cursor_at = None # Page and column of the drawn cursor
+        self.clear()
+
+    def clear( self ):
+        """ Clear the screen and move the cursor home """
+        self.lcd.fill(0)
+        self._top = 0 # FrameBuffer page shown at the top
+        self._start = -1 # Start line on LCD, -1 - unknown
+        self._shown_top = -1 # Top page for the start line on LCD, -1 - unknown
+        self._cursor_at = None
+        self.col = 0
+        self.row = 0
+        for page in range(LCD_PAGES):
+            self._mark(page, 0, LCD_WIDTH)
+
+    def _page( self, row ):
+        """ FrameBuffer page of the first page of a screen row """
+        return (self._top + row * self.line_pages) % LCD_PAGES
+
+    def _mark( self, page, x0, x1 ):
+        pending = self._pending
+        i = page * 2
+        if pending[i] == pending[i + 1]: # Nothing pending yet
+            pending[i] = x0
+            pending[i + 1] = x1
+        else:
+            if x0 < pending[i]:
+                pending[i] = x0
+            if x1 > pending[i + 1]:
+                pending[i + 1] = x1
+
+    def _clear_line( self, row ):
+        page = self._page(row)
+        self.lcd.fill_rect(0, page * 8, LCD_WIDTH, self.line_pages * 8, 0)
+        for p in range(page, page + self.line_pages):
+            self._mark(p, 0, LCD_WIDTH)
+
+    def _newline( self ):
+        self.col = 0
+        if self.row < self.rows - 1:
+            self.row += 1
+        else: # Scroll: the top line becomes the new bottom line
+            self._top = (self._top + self.line_pages) % LCD_PAGES
+            self._clear_line(self.rows - 1)
+
+    def _draw_cursor( self ):
+        """ Toggle the underline of the cursor cell """
+        page, x = self._cursor_at
+        y = page * 8 + self.line_pages * 8 - 1
+        for k in range(x, x + self.cell):
+            self.lcd.pixel(k, y, 1 - self.lcd.pixel(k, y))
+        self._mark(page + self.line_pages - 1, x, x + self.cell)
+
+    def write( self, text ):
+        """ Write text at the cursor. Nothing is sent until flush()
+        Args
+        text (string): Text, may hold newline, CR, backspace and tab
+        Return (int): Number of characters
+        """
+        if self._cursor_at:
+            self._draw_cursor()
+            self._cursor_at = None
+        lcd = self.lcd
+        font = self.font
+        cell = self.cell
+        current_font = lcd._font
+        if font is not None:
+            lcd.set_font(font)
+        for char in text:
+            if char == '\n':
+                self._newline()
+            elif char == '\r':
+                self.col = 0
+            elif char == '\b':
+                if self.col > 0:
+                    self.col -= 1
+            elif char == '\t':
+                self.col = min((self.col | 3) + 1, self.cols - 1)
+            else:
+                if self.col >= self.cols:
+                    self._newline()
+                page = self._page(self.row)
+                x = self.col * cell
+                lcd.fill_rect(x, page * 8, cell, self.line_pages * 8, 0)
+                if font is None:
+                    lcd.text(char, x, page * 8, 1)
+                else:
+                    lcd.draw_text(char, x, page * 8, 1)
+                for p in range(page, page + self.line_pages):
+                    self._mark(p, x, x + cell)
+                self.col += 1
+        if font is not None:
+            lcd.set_font(current_font)
+        return len(text)
+
+    def _start_line( self ):
+        """ Start line that shows the top page at the top of the screen """
+        if self.lcd._rotation:
+            return ((LCD_PAGES - self._top) % LCD_PAGES) * 8
+        return self._top * 8
+
+    def flush( self, max_pages = LCD_PAGES ):
+        """ Send pending changes to LCD, from the bottom of the screen, so
+        new lines go first. The start line moves once the pages scrolled
+        in at the bottom are sent
+        Args
+        max_pages (int): Most pages to send now, the rest stays pending
+        Return (int): Number of bytes sent
+        """
+        if self.cursor:
+            col = min(self.col, self.cols - 1)
+            at = (self._page(self.row), col * self.cell)
+            if at != self._cursor_at:
+                if self._cursor_at:
+                    self._draw_cursor()
+                self._cursor_at = at
+                self._draw_cursor()
+
+        lcd = self.lcd
+        buffer = lcd.buffer
+        pending = self._pending
+        sent = 0
+        pages = 0
+        for row in range(LCD_PAGES - 1, -1, -1): # From the bottom of the screen
+            page = (self._top + row) % LCD_PAGES
+            i = page * 2
+            x0 = pending[i]
+            x1 = pending[i + 1]
+            if x0 < x1:
+                if pages == max_pages:
+                    break
+                lcd._write_span(buffer, page * LCD_WIDTH + x0, page, x0, x1 - x0)
+                pending[i] = pending[i + 1] = 0
+                sent += x1 - x0
+                pages += 1
+
+        # Until then the start line keeps showing the lines scrolled out
+        page = self._shown_top
+        while page >= 0 and page != self._top:
+            if pending[page * 2] < pending[page * 2 + 1]:
+                return sent
+            page = (page + 1) % LCD_PAGES
+
+        start = self._start_line()
+        if start != self._start:
+            lcd._select_chip(0) # All chips
+            lcd._set_start(start)
+            self._start = start
+        self._shown_top = self._top
+        return sent
+
+    def show( self ):
+        """ Send the whole screen """
+        for page in range(LCD_PAGES):
+            self._mark(page, 0, LCD_WIDTH)
+        self.flush()
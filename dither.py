@@ -0,0 +1,173 @@
+"""
+Streaming dithering for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Turns rows of 8-bit gray pixels (0 - black, 255 - white) into set and clear
+pixels written straight into the FrameBuffer. Rows come one at a time from
+a list, a generator or a file, so a picture never needs to be in RAM.
+Error diffusion keeps only the current and two next rows of error.
+tools/dither_image.py gives the same pixels on a PC.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+dith = Dither( lcd, 192, mode = ATKINSON )
+with open( "photo.gray", "rb" ) as f:
+    dith.write_stream( f, 64 )
+lcd.show_dirty()
+"""
+LCD_WIDTH   = const(192)
+LCD_HEIGHT  = const(64)
+
+BAYER           = const(0) # Ordered 4x4 Bayer matrix
+FLOYD_STEINBERG = const(1) # Error diffusion 7/16, 3/16, 5/16, 1/16
+ATKINSON        = const(2) # Error diffusion 1/8 to six pixels, 2/8 dropped
+
+BIAS = const(0x4000) # Zero error, errors are stored unsigned
+
+# Gray level below which a pixel is set, by (row & 3) * 4 + (column & 3)
+# of the picture
+BAYER_4X4 = bytes((  8, 136,  40, 168,
+                   200,  72, 232, 104,
+                    56, 184,  24, 152,
+                   248, 120, 216,  88 ))
+
+class Dither:
+    def __init__( self, lcd, width, x = 0, y = 0, mode = FLOYD_STEINBERG ):
+        """ Dither constructor
+        Args
+        lcd   (LCD19264): Display
+        width (int): Width of rows
+        x     (int): Start X position
+        y     (int): Y position of the first row
+        mode  (int): BAYER, FLOYD_STEINBERG or ATKINSON
+        """
+        self.lcd = lcd
+        self.width = width
+        self.x = x
+        self.mode = mode
+        # Three rows of error with two columns of margin at both ends
+        self._err = bytearray(2 * 3 * (width + 4))
+        self.reset(y)
+
+    def reset( self, y = 0 ):
+        """ Start a new picture
+        Args
+        y (int): Y position of its first row
+        """
+        self.y = y
+        self._top = y
+        self._row = 0
+        err = self._err
+        for i in range(0, len(err), 2):
+            err[i] = BIAS & 0xFF
+            err[i + 1] = BIAS >> 8
+
+    def write_row( self, row ):
+        """ Dither one row into FrameBuffer and mark it for show_dirty()
+        Args
+        row (buffer): width gray bytes
+        """
+        self._dither_row(row, self.y)
+        self.lcd.mark_dirty(self.x, self.y, self.width, 1)
+        self.y += 1
+
+    def write( self, rows ):
+        """ Dither rows into FrameBuffer and mark them for show_dirty()
+        Args
+        rows (iterable): Rows of width gray bytes
+        Return (int): Number of rows
+        """
+        y = self.y
+        for row in rows:
+            self._dither_row(row, self.y)
+            self.y += 1
+        self.lcd.mark_dirty(self.x, y, self.width, self.y - y)
+        return self.y - y
+
+    def write_stream( self, f, height ):
+        """ Dither rows read from a stream through one row buffer and mark
+        them for show_dirty()
+        Args
+        f      (stream): Gray bytes, row after row
+        height (int): Number of rows to read
+        Return (int): Number of rows read
+        """
+        row = bytearray(self.width)
+        y = self.y
+        for i in range(height):
+            if f.readinto(row) != len(row):
+                break
+            self._dither_row(row, self.y)
+            self.y += 1
+        self.lcd.mark_dirty(self.x, y, self.width, self.y - y)
+        return self.y - y
+
+    @micropython.viper
+    def _dither_row( self, src, y:int ):
+        """ Dither one row, pixels off screen only pass their error on
+        Args
+        src (buffer): Gray bytes
+        y   (int): Y position of the row
+        """
+        gray  = ptr8(src)
+        buf   = ptr8(self.lcd.buffer)
+        err   = ptr16(self._err)
+        bayer = ptr8(BAYER_4X4)
+        width = int(self.width)
+        x0    = int(self.x)
+        mode  = int(self.mode)
+        stride = width + 4
+        r = int(self._row)
+        cur  = r * stride + 2
+        nxt  = ((r + 1) % 3) * stride + 2
+        nxt2 = ((r + 2) % 3) * stride + 2
+        visible = 0
+        if y >= 0 and y < LCD_HEIGHT:
+            visible = 1
+        offset = (y >> 3) * LCD_WIDTH
+        bit = 1 << (y & 7)
+        threshold = ((y - int(self._top)) & 3) << 2
+
+        for i in range(width):
+            v = gray[i]
+            on = 0
+            if mode == BAYER:
+                if v < bayer[threshold + (i & 3)]:
+                    on = 1
+            else:
+                v += err[cur + i] - BIAS
+                if v < 128:
+                    on = 1
+                    e = v
+                else:
+                    e = v - 255
+                if mode == FLOYD_STEINBERG:
+                    e7 = (e * 7 + 8) >> 4
+                    e3 = (e * 3 + 8) >> 4
+                    e5 = (e * 5 + 8) >> 4
+                    err[cur + i + 1] += e7
+                    err[nxt + i - 1] += e3
+                    err[nxt + i] += e5
+                    err[nxt + i + 1] += e - e7 - e3 - e5
+                else:
+                    e = (e + 4) >> 3
+                    err[cur + i + 1] += e
+                    err[cur + i + 2] += e
+                    err[nxt + i - 1] += e
+                    err[nxt + i] += e
+                    err[nxt + i + 1] += e
+                    err[nxt2 + i] += e
+            x = x0 + i
+            if visible and x >= 0 and x < LCD_WIDTH:
+                if on:
+                    buf[offset + x] |= bit
+                else:
+                    buf[offset + x] &= 0xFF ^ bit
+
+        # Current row of error becomes the row after the next ones
+        start = r * stride
+        for i in range(stride):
+            err[start + i] = BIAS
+        self._row = (r + 1) % 3
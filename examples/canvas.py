@@ -0,0 +1,24 @@
+from lcd19264 import LCD19264
+from canvas import Canvas
+from time import sleep_ms
+
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+#lcd.set_rotation()
+
+# Dashboard of three screens side by side, rendered once
+canvas = Canvas(lcd, 576, 64)
+for i in range(3):
+    x = i * 192
+    canvas.rect(x, 0, 192, 64, 1)
+    canvas.text('Screen %d' % (i + 1), x + 60, 4, 1)
+    for k in range(10):
+        canvas.fill_rect(x + 12 + k * 17, 60 - (k * 7 + i * 13) % 40, 12, (k * 7 + i * 13) % 40, 1)
+
+step = 4
+while True:
+    # Every frame is only the bus transfer of the viewport
+    if not canvas.pan(step, 0):
+        step = -step
+        sleep_ms(1000)
+    canvas.show()
@@ -0,0 +1,19 @@
+from lcd19264 import LCD19264
+from console import Console
+from time import ticks_ms, sleep_ms
+
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+#lcd.set_rotation()
+
+con = Console(lcd)
+print('Console ready', file = con)
+
+n = 0
+while True:
+    # A burst of log lines costs one refresh
+    for i in range(3):
+        print('%d: t=%d ms' % (n, ticks_ms()), file = con)
+        n += 1
+    con.flush() # Scrolls by the start line, sends only new lines
+    sleep_ms(200)
@@ -0,0 +1,33 @@
+from lcd19264 import LCD19264
+from sprite import Sprite, Sprites
+from bitmaps import sun, drop, fan
+from time import sleep_ms
+
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+#lcd.set_rotation()
+
+# Background stays intact under sprites
+lcd.fill(0)
+for y in range(0, lcd.height, 8):
+    lcd.text('Sprites over text', 24, y, 1)
+lcd.show()
+
+sprites = Sprites(lcd)
+balls = [sprites.add(Sprite(sun, x = 10, y = 5)),
+         sprites.add(Sprite(drop, x = 80, y = 30, z = 1)),
+         sprites.add(Sprite(fan, mask = fan, x = 150, y = 20, z = 2))]
+speeds = [[2, 1], [-1, 2], [-2, -1]]
+
+while True:
+    for ball, speed in zip(balls, speeds):
+        x = ball.x + speed[0]
+        y = ball.y + speed[1]
+        if x < 0 or x + ball.width > lcd.width:
+            speed[0] = -speed[0]
+        if y < 0 or y + ball.height > lcd.height:
+            speed[1] = -speed[1]
+        ball.move(x, y)
+    sprites.update()
+    lcd.show_dirty() # Only pages touched by sprites
+    sleep_ms(20)
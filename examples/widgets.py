@@ -0,0 +1,28 @@
+from lcd19264 import LCD19264
+from widgets import Screen, Frame, Label, Value, Bar, Icon
+from bitmaps import sun, drop
+import LibreBodoni20 as MY_FONT
+from random import getrandbits
+from time import sleep_ms
+
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+#lcd.set_rotation()
+
+screen = Screen(lcd)
+screen.add(Frame(0, 0, 192, 64, 'Weather'))
+screen.add(Label(8, 12, 'Temp'))
+temp = screen.add(Value(8, 24, '{:.1f} C', 20.0, font = MY_FONT, width = 80))
+icon = screen.add(Icon(100, 14, sun))
+humidity = screen.add(Bar(8, 50, 120, 8))
+screen.add(Label(134, 50, 'hum'))
+screen.redraw()
+
+value = 20.0
+while True:
+    value += (getrandbits(3) - 3.5) / 10
+    temp.set(value)
+    humidity.set(getrandbits(7) % 101)
+    icon.set_bitmap(sun if value > 20 else drop)
+    sent = screen.update() # Only changed widgets go to lcd
+    sleep_ms(100)
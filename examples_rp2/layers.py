@@ -0,0 +1,27 @@
+from lcd19264_rp2 import LCD19264
+from layers import Compositor, XOR
+from time import sleep_ms
+
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+#lcd.set_rotation()
+
+comp = Compositor(lcd)
+back = comp.add_layer()
+alert = comp.add_layer(XOR)
+
+back.rect(0, 0, 192, 64, 1)
+for i in range(5):
+    back.text('Sensor %d: %d' % (i + 1, 20 + i * 3), 8, 6 + i * 10, 1)
+back.mark_dirty(0, 0, 192, 64)
+
+alert.fill_rect(120, 24, 64, 16, 1)
+alert.text('ALARM', 132, 28, 0)
+alert.mark_dirty(120, 24, 64, 16)
+comp.update()
+
+while True:
+    # Blinking costs the alert area only, the sensors are not redrawn
+    alert.set_visible(not alert.visible)
+    comp.update()
+    sleep_ms(500)
@@ -0,0 +1,37 @@
+from lcd19264_rp2 import LCD19264
+from tilemap import Tilemap
+from random import getrandbits
+
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+#lcd.set_rotation()
+
+# 8x8 tiles, 8 VLSB column bytes each: sky, ground, brick, cloud
+tiles = bytes([0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
+               0xFF,0xFD,0xFF,0xF7,0xFF,0xBF,0xFF,0xEF,
+               0xFF,0x81,0x81,0xFF,0xFF,0x18,0x18,0xFF,
+               0x18,0x3C,0x3E,0x7E,0x7E,0x3C,0x3C,0x18])
+
+# Side scrolling world: 128 x 8 tiles
+MAP_WIDTH = 128
+world = bytearray(MAP_WIDTH * 8)
+for col in range(MAP_WIDTH):
+    ground = 5 + (getrandbits(2) == 0)
+    for row in range(ground, 8):
+        world[row * MAP_WIDTH + col] = 1
+    if getrandbits(3) == 0:
+        world[(ground - 1) * MAP_WIDTH + col] = 2
+    if getrandbits(3) == 0:
+        world[getrandbits(1) * MAP_WIDTH + col] = 3
+
+view = Tilemap(lcd, tiles, world, MAP_WIDTH)
+lcd.fill(0)
+view.draw()
+lcd.show()
+
+while True:
+    for x in range(MAP_WIDTH * 8 - lcd.width):
+        view.scroll_to(x, 0) # Only one new column is rendered
+        lcd.show_dirty()
+    view.scroll_to(0, 0)
+    lcd.show_dirty()
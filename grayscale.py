@@ -0,0 +1,193 @@
+"""
+Temporal grayscale for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Two bit-planes are shown in turn, the high plane twice as long as the low
+one, so a pixel looks black, dark gray, light gray or clear (levels 3..0).
+The high plane is the FrameBuffer of the driver, the low plane is a second
+FrameBuffer. On every switch only the column spans that differ between the
+planes are sent, which keeps the switching rate high.
+
+Switching is done by a Timer (start), by calling step() from a loop, or by
+run() on the second core (_thread). rate() reports the achieved plane rate.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+gray = Grayscale( lcd )
+for level in range(4):
+    gray.fill_rect( level * 48, 0, 48, 64, level )
+gray.show()
+gray.start()
+"""
+from framebuf import FrameBuffer, MONO_VLSB
+from machine import Timer
+from time import ticks_us, ticks_diff, ticks_add
+
+LCD_WIDTH    = const(192)
+LCD_HEIGHT   = const(64)
+LCD_BUFFSIZE = const( LCD_WIDTH * LCD_HEIGHT // 8 )
+
+class Grayscale:
+    def __init__( self, lcd, unit_us = 2000, weights = (2, 1) ):
+        """ Grayscale constructor
+        Args
+        lcd     (LCD19264): Display, its FrameBuffer is the high plane
+        unit_us (int): Time unit of plane durations in microseconds
+        weights (tuple): Time units the high and the low plane are shown
+        """
+        self.lcd = lcd
+        self.low_buffer = bytearray(LCD_BUFFSIZE)
+        self.low = FrameBuffer(self.low_buffer, LCD_WIDTH, LCD_HEIGHT, MONO_VLSB)
+        self.unit_us = unit_us
+        self.weights = weights
+        self._spans = bytearray(48) # Differing columns, x0 and x1 per page and chip
+        self._plane = 0             # Plane on LCD: 0 - high, 1 - low
+        self._units = 0
+        self._due = 0
+        self._timer = None
+        self._running = False
+        self._switches = 0
+        self._start = ticks_us()
+        self._max_us = 0
+
+    """ DRAWING, level 0..3 """
+
+    def pixel( self, x, y, level ):
+        self.lcd.pixel(x, y, level >> 1)
+        self.low.pixel(x, y, level & 1)
+
+    def fill( self, level ):
+        self.lcd.fill(level >> 1)
+        self.low.fill(level & 1)
+
+    def fill_rect( self, x, y, w, h, level ):
+        self.lcd.fill_rect(x, y, w, h, level >> 1)
+        self.low.fill_rect(x, y, w, h, level & 1)
+
+    def rect( self, x, y, w, h, level ):
+        self.lcd.rect(x, y, w, h, level >> 1)
+        self.low.rect(x, y, w, h, level & 1)
+
+    def line( self, x1, y1, x2, y2, level ):
+        self.lcd.line(x1, y1, x2, y2, level >> 1)
+        self.low.line(x1, y1, x2, y2, level & 1)
+
+    def text( self, s, x, y, level ):
+        """ Draw text with the built-in 8x8 font, only set pixels change """
+        if level >> 1:
+            self.lcd.text(s, x, y, 1)
+        if level & 1:
+            self.low.text(s, x, y, 1)
+
+    """ REFRESH """
+
+    def show( self ):
+        """ Send the high plane and find the spans differing between planes.
+        Call after drawing, planes keep alternating from the high one
+        """
+        self._find_spans(self.lcd.buffer, self.low_buffer)
+        self.lcd.show()
+        self._plane = 0
+        self._units = 0
+        self._due = ticks_add(ticks_us(), self.unit_us * self.weights[0])
+        self._switches = 0
+        self._start = ticks_us()
+        self._max_us = 0
+
+    def _switch( self ):
+        """ Send the other plane, only where the planes differ """
+        started = ticks_us()
+        plane = self._plane ^ 1
+        buffer = self.low_buffer if plane else self.lcd.buffer
+        write_span = self.lcd._write_span
+        spans = self._spans
+        for page in range(8):
+            for chip in range(3):
+                i = (page * 3 + chip) * 2
+                x0 = spans[i]
+                x1 = spans[i + 1]
+                if x0 < x1:
+                    write_span(buffer, page * LCD_WIDTH + x0, page, x0, x1 - x0)
+        self._plane = plane
+        self._switches += 1
+        took = ticks_diff(ticks_us(), started)
+        if took > self._max_us:
+            self._max_us = took
+
+    def step( self ):
+        """ Switch planes if the shown one is due. Call as often as possible
+        Return (bool): True if planes were switched
+        """
+        now = ticks_us()
+        if ticks_diff(now, self._due) < 0:
+            return False
+        self._switch()
+        self._due = ticks_add(self._due, self.unit_us * self.weights[self._plane])
+        if ticks_diff(self._due, now) < 0: # Late: start timing again from now
+            self._due = ticks_add(now, self.unit_us * self.weights[self._plane])
+        return True
+
+    def _tick( self, timer ):
+        self._units += 1
+        if self._units >= self.weights[self._plane]:
+            self._units = 0
+            self._switch()
+
+    def start( self, timer_id = -1 ):
+        """ Switch planes from a periodic Timer of one time unit
+        Args
+        timer_id (int): Timer to use, -1 - virtual timer
+        """
+        self.stop()
+        self._timer = Timer(timer_id)
+        self._timer.init(freq = 1000000 // self.unit_us, mode = Timer.PERIODIC, callback = self._tick)
+
+    def run( self ):
+        """ Switch planes until stop(). Blocks, meant for the second core:
+        _thread.start_new_thread( gray.run, () )
+        """
+        self._running = True
+        while self._running:
+            self.step()
+
+    def stop( self ):
+        """ Stop switching and leave the high plane on LCD """
+        self._running = False
+        if self._timer:
+            self._timer.deinit()
+            self._timer = None
+        if self._plane:
+            self._switch()
+
+    def rate( self ):
+        """ Achieved switching since show()
+        Return (tuple): Planes per second, longest plane transfer in microseconds
+        """
+        elapsed = ticks_diff(ticks_us(), self._start)
+        per_second = self._switches * 1000000 // elapsed if elapsed > 0 else 0
+        return per_second, self._max_us
+
+    @micropython.viper
+    def _find_spans( self, high, low ):
+        """ Find first and last differing column per page and chip
+        Args
+        high (bytearray): High plane
+        low  (bytearray): Low plane
+        """
+        hi = ptr8(high)
+        lo = ptr8(low)
+        spans = ptr8(self._spans)
+        for page in range(8):
+            for chip in range(3):
+                x0 = chip << 6
+                x1 = x0 + 64
+                base = page * LCD_WIDTH
+                while x0 < x1 and hi[base + x0] == lo[base + x0]:
+                    x0 += 1
+                while x1 > x0 and hi[base + x1 - 1] == lo[base + x1 - 1]:
+                    x1 -= 1
+                i = (page * 3 + chip) * 2
+                spans[i] = x0
+                spans[i + 1] = x1
@@ -0,0 +1,217 @@
+"""
+Compositing layers for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Background, content and overlay are drawn into separate 1-bit layers,
+each a FrameBuffer of the screen size. The compositor combines visible
+layers from the bottom up with OR, AND-NOT or XOR into the FrameBuffer of
+LCD, which keeps the flattened result. Layers mark the areas they change,
+and only those column spans of the touched pages are combined again and
+sent, so blinking an overlay costs one span instead of a redraw.
+
+The compositor owns the FrameBuffer of LCD: draw into layers, not into it.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+comp = Compositor( lcd )
+back = comp.add_layer()
+alert = comp.add_layer( XOR )
+back.text( "Temp 21.5", 0, 0, 1 )
+back.mark_dirty( 0, 0, 72, 8 )
+alert.fill_rect( 0, 56, 192, 8, 1 )
+alert.mark_dirty( 0, 56, 192, 8 )
+while True:
+    alert.set_visible( not alert.visible )
+    comp.update()
+"""
+from framebuf import FrameBuffer, MONO_VLSB
+
+LCD_WIDTH   = const(192)
+LCD_HEIGHT  = const(64)
+LCD_PAGES   = const(8)
+
+OR          = const(0) # Set pixels of the layer
+ANDNOT      = const(1) # Clear pixels of the layer
+XOR         = const(2) # Invert pixels of the layer
+_COPY       = const(3) # Bottom layer
+_CLEAR      = const(4) # No visible layer
+
+def _mark( spans, x, y, w, h ):
+    """ Merge an area into column spans per page """
+    x1 = min(x + w, LCD_WIDTH)
+    y1 = min(y + h, LCD_HEIGHT)
+    x = max(x, 0)
+    y = max(y, 0)
+    if x >= x1 or y >= y1:
+        return
+    for page in range(y >> 3, ((y1 - 1) >> 3) + 1):
+        i = page * 2
+        if spans[i] == spans[i + 1]: # Empty
+            spans[i] = x
+            spans[i + 1] = x1
+        else:
+            if x < spans[i]:
+                spans[i] = x
+            if x1 > spans[i + 1]:
+                spans[i + 1] = x1
+
+class Layer( FrameBuffer ):
+    def __init__( self, op = OR ):
+        """ Layer constructor, use Compositor.add_layer()
+        Args
+        op (int): OR, ANDNOT or XOR - how the layer combines with layers below
+        """
+        self.op = op
+        self.visible = True
+        self.buffer = bytearray( LCD_WIDTH * LCD_PAGES )
+        super().__init__( self.buffer, LCD_WIDTH, LCD_HEIGHT, MONO_VLSB )
+        self._dirty = bytearray(2 * LCD_PAGES) # Column span x0, x1 per page
+        self._used = bytearray(2 * LCD_PAGES)  # Span drawn since clear()
+
+    def mark_dirty( self, x, y, w, h ):
+        """ Mark a changed area of the layer to be combined again by update()
+        Args
+        x (int): Start X position
+        y (int): Start Y position
+        w (int): Width of area
+        h (int): Height of area
+        """
+        _mark(self._used, x, y, w, h)
+        if self.visible:
+            _mark(self._dirty, x, y, w, h)
+
+    def _mark_used( self ):
+        """ Mark everything drawn since clear() """
+        used = self._used
+        dirty = self._dirty
+        for page in range(LCD_PAGES):
+            i = page * 2
+            if used[i] != used[i + 1]:
+                _mark(dirty, used[i], page * 8, used[i + 1] - used[i], 8)
+
+    def set_visible( self, visible ):
+        """ Show or hide the layer """
+        visible = bool(visible)
+        if visible != self.visible:
+            self.visible = visible
+            self._mark_used()
+
+    def set_op( self, op ):
+        """ Change how the layer combines with layers below """
+        if op != self.op:
+            self.op = op
+            if self.visible:
+                self._mark_used()
+
+    def clear( self ):
+        """ Clear the layer and mark what was drawn on it """
+        self.fill(0)
+        if self.visible:
+            self._mark_used()
+        used = self._used
+        for i in range(len(used)):
+            used[i] = 0
+
+class Compositor:
+    def __init__( self, lcd ):
+        """ Compositor constructor
+        Args
+        lcd (LCD19264): Display
+        """
+        self.lcd = lcd
+        self.layers = []
+        self._spans = bytearray(2 * LCD_PAGES)
+
+    def add_layer( self, op = OR ):
+        """ Add a layer on top of the others
+        Args
+        op (int): OR, ANDNOT or XOR
+        Return (Layer): New layer
+        """
+        layer = Layer(op)
+        self.layers.append(layer)
+        return layer
+
+    def remove_layer( self, layer ):
+        """ Remove a layer and combine what it covered again """
+        layer.set_visible(False)
+        self.compose()
+        self.layers.remove(layer)
+
+    def compose( self ):
+        """ Combine changed spans of layers into FrameBuffer and mark them
+        for show_dirty()
+        """
+        spans = self._spans
+        layers = self.layers
+        for i in range(len(spans)):
+            spans[i] = 0
+        for layer in layers:
+            dirty = layer._dirty
+            for page in range(LCD_PAGES):
+                i = page * 2
+                if dirty[i] != dirty[i + 1]:
+                    _mark(spans, dirty[i], page * 8, dirty[i + 1] - dirty[i], 8)
+                    dirty[i] = dirty[i + 1] = 0
+
+        lcd = self.lcd
+        for page in range(LCD_PAGES):
+            i = page * 2
+            x0 = spans[i]
+            x1 = spans[i + 1]
+            if x0 == x1:
+                continue
+            start = page * LCD_WIDTH + x0
+            end = page * LCD_WIDTH + x1
+            bottom = True
+            for layer in layers:
+                if layer.visible:
+                    op = layer.op
+                    if bottom: # Combine with a clear screen
+                        op = _CLEAR if op == ANDNOT else _COPY
+                        bottom = False
+                    self._apply(layer.buffer, start, end, op)
+            if bottom:
+                self._apply(lcd.buffer, start, end, _CLEAR)
+            lcd.mark_dirty(x0, page * 8, x1 - x0, 8)
+
+    def update( self ):
+        """ Compose changed spans and send them to LCD
+        Return (int): Number of bytes sent
+        """
+        self.compose()
+        return self.lcd.show_dirty()
+
+    def invalidate( self ):
+        """ Compose and send the whole screen on the next update() """
+        for layer in self.layers:
+            _mark(layer._dirty, 0, 0, LCD_WIDTH, LCD_HEIGHT)
+
+    @micropython.viper
+    def _apply( self, src, start:int, end:int, op:int ):
+        """ Combine a run of layer bytes into FrameBuffer
+        Args
+        src   (buffer): Layer buffer
+        start (int): First byte of the run
+        end   (int): End of the run
+        op    (int): OR, ANDNOT, XOR, _COPY or _CLEAR
+        """
+        s = ptr8(src)
+        buf = ptr8(self.lcd.buffer)
+        if op == OR:
+            for i in range(start, end):
+                buf[i] = buf[i] | s[i]
+        elif op == ANDNOT:
+            for i in range(start, end):
+                buf[i] = buf[i] & (0xFF ^ s[i])
+        elif op == XOR:
+            for i in range(start, end):
+                buf[i] = buf[i] ^ s[i]
+        elif op == _COPY:
+            for i in range(start, end):
+                buf[i] = s[i]
+        else:
+            for i in range(start, end):
+                buf[i] = 0
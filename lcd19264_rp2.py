@@ -35,7 +35,7 @@ Pinout
 I use a 1 Mega Ohm variable resistor. Acceptable contrast ~270kOm
 
 """
-from framebuf import FrameBuffer, MONO_VLSB, MONO_HLSB
+from framebuf import FrameBuffer, MONO_VLSB
 from time import sleep_us
 from machine import Pin
 
@@ -49,6 +49,11 @@ LCD_DISPLAY_OFF  = const(0x3E)
 LCD_ADDR_Y       = const(0x40)
 LCD_ADDR_X       = const(0xB8)
 LCD_ADDR_Z       = const(0xC0)
+
+# Modes of _blit_hlsb
+BLIT_TRAN        = const(0) # Only set bits of the bitmap are drawn
+BLIT_OPAQUE      = const(1) # Set bits in color, clear bits in the other color
+BLIT_MASK        = const(2) # As BLIT_OPAQUE, only where the mask is set
         
 class LCD19264( FrameBuffer ):
     
@@ -82,15 +87,20 @@ class LCD19264( FrameBuffer ):
         self._rotation = False
         self._text_wrap = False
         self._font = None
+        self._font_packed = False
+        self._scale_luts = {} # Bit-doubling tables by scale
+        self._scaled = bytearray(0) # Scratch for enlarged glyphs
+        self._unpacked = bytearray(0) # Scratch for unpacked glyphs
+        self._band = bytearray(0) # Scratch for 8 unpacked glyph rows
+        self._block = bytearray(16) # 8 bitmap rows and 8 mask rows for _blit_hlsb
+        self._dirty = bytearray(48) # Column span [x0, x1) per page and chip
+        self._clear_dirty()
+        self._clip = bytearray((0, 0, LCD_WIDTH, LCD_HEIGHT)) # x0, y0, x1, y1
+        self._clips = [] # Clip areas saved by push_clip()
 
-        # Alternative inverted palette for text
-        self._palette = FrameBuffer( bytearray(2), 2, 1, MONO_HLSB )
-        self._palette.pixel(0, 0, 1) # bg = 1
-        self._palette.pixel(1, 0, 0) # fg = 0        
-            
         # Initialize the FrameBuffer
-        self._buffer = bytearray( LCD_BUFFSIZE )
-        super().__init__( self._buffer, self.width, self.height, MONO_VLSB )
+        self.buffer = bytearray( LCD_BUFFSIZE )
+        super().__init__( self.buffer, self.width, self.height, MONO_VLSB )
         
         self.en_bit  = 1 << en
         self.data_pins = [ db0, db1, db2, db3, db4, db5, db6, db7 ]
@@ -309,7 +319,7 @@ class LCD19264( FrameBuffer ):
     @micropython.viper
     def show( self ):
         ''' Send FrameBuffer to LCD '''
-        buf = ptr8(self._buffer)
+        buf = ptr8(self.buffer)
         addrSize = LCD_WIDTH * 8
 
         data_mask = int(self.data_mask)
@@ -324,10 +334,10 @@ class LCD19264( FrameBuffer ):
             byte2gpio = ptr32(self.BYTE2GPIO)
         
         self._set_start(0) # Set start point 0
-        self._set_address(0) # Set begin position to 0
         
         for chip in range(0, 3):
             self._select_chip(chip + 1)
+            self._set_address(0) # Set begin position to 0, partial refresh may have moved it
                             
             for page in range(0, 8):
                 self._set_page(page)
@@ -354,27 +364,223 @@ class LCD19264( FrameBuffer ):
                     sleep_us(1)
                 
         self._write_cmd(LCD_DISPLAY_ON)
+        self._clear_dirty()
+
+    @micropython.viper
+    def _write_span( self, data, offset:int, page:int, x:int, count:int ):
+        """ Send a run of page bytes to LCD. The run may cross chips
+        Args
+        data   (buffer): VLSB page bytes, laid out as in FrameBuffer
+        offset (int): Position of the first byte in data
+        page   (int): 0..7 - Page of the run on FrameBuffer
+        x      (int): 0..191 - Column of the first byte on FrameBuffer
+        count  (int): Number of bytes
+        """
+        src = ptr8(data)
+        data_mask = int(self.data_mask)
+        en_bit = int(self.en_bit)
+        rotation = self._rotation
+
+        GPIO_OUT  = ptr32(GPIO_OUT_REG)
+
+        if rotation: # Run is mirrored on the LCD, bits are reversed by table
+            byte2gpio = ptr32(self.BYTE2RGPIO)
+            page = 7 - page
+            col = LCD_WIDTH - x - count
+            step = -1
+            pos = offset + count - 1
+        else:
+            byte2gpio = ptr32(self.BYTE2GPIO)
+            col = x
+            step = 1
+            pos = offset
+        end = col + count
+
+        while col < end:
+            chip = col >> 6
+            stop = (chip + 1) << 6
+            if stop > end:
+                stop = end
+            self._select_chip(chip + 1)
+            self._set_page(page)
+            self._set_address(col & 63)
+            self.rs.on()  # RS = 1 (Data)
+            self.rw.off()  # RW = 0 (Write)
+
+            empty_mask = GPIO_OUT[0] & ~data_mask
+            while col < stop:
+                gpio = byte2gpio[ src[ pos ] ] | empty_mask
+
+                GPIO_OUT[0] = gpio | en_bit
+                sleep_us(1)
+                GPIO_OUT[0] = gpio
+                sleep_us(1)
+                pos += step
+                col += 1
+
+    def show_area( self, x, y, w, h ):
+        """ Send a part of FrameBuffer to LCD. The area is widened to whole pages
+        Args
+        x (int): Start X position
+        y (int): Start Y position
+        w (int): Width of area
+        h (int): Height of area
+        """
+        x1 = min(x + w, LCD_WIDTH)
+        y1 = min(y + h, LCD_HEIGHT)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x >= x1 or y >= y1:
+            return
+        for page in range(y >> 3, ((y1 - 1) >> 3) + 1):
+            self._write_span(self.buffer, page * LCD_WIDTH + x, page, x, x1 - x)
+
+    def mark_dirty( self, x, y, w, h ):
+        """ Mark a changed area of FrameBuffer to be sent by show_dirty().
+        Areas are merged into one column span per page and chip
+        Args
+        x (int): Start X position
+        y (int): Start Y position
+        w (int): Width of area
+        h (int): Height of area
+        """
+        x1 = min(x + w, LCD_WIDTH)
+        y1 = min(y + h, LCD_HEIGHT)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x >= x1 or y >= y1:
+            return
+        dirty = self._dirty
+        for page in range(y >> 3, ((y1 - 1) >> 3) + 1):
+            for chip in range(x >> 6, ((x1 - 1) >> 6) + 1):
+                i = (page * 3 + chip) * 2
+                if x < dirty[i]:
+                    dirty[i] = x
+                if x1 > dirty[i + 1]:
+                    dirty[i + 1] = x1
+
+    def show_dirty( self ):
+        """ Send areas marked by mark_dirty() to LCD
+        Return (int): Number of bytes sent
+        """
+        dirty = self._dirty
+        buffer = self.buffer
+        sent = 0
+        for page in range(8):
+            for chip in range(3):
+                i = (page * 3 + chip) * 2
+                x0 = max(dirty[i], chip * LCD_HEIGHT)
+                x1 = min(dirty[i + 1], chip * LCD_HEIGHT + LCD_HEIGHT)
+                if x0 < x1:
+                    self._write_span(buffer, page * LCD_WIDTH + x0, page, x0, x1 - x0)
+                    sent += x1 - x0
+                dirty[i] = LCD_WIDTH
+                dirty[i + 1] = 0
+        return sent
+
+    def _clear_dirty( self ):
+        """ Forget areas marked by mark_dirty() """
+        dirty = self._dirty
+        for i in range(0, len(dirty), 2):
+            dirty[i] = LCD_WIDTH
+            dirty[i + 1] = 0
+
+    def show_image( self, source, rotate = False ):
+        """ Stream a panel-native image from a file straight to LCD.
+        FrameBuffer is not touched, so the next show() overwrites the image
+        Args
+        source (string or stream): Filename or open file made by save_image()
+        rotate (bool): Rotate image by 180 degrees
+        """
+        f = open(source, 'rb') if isinstance(source, str) else source
+        chunk = bytearray(LCD_HEIGHT)
+        rotation = self._rotation
+        if rotate:
+            self._rotation = not rotation
+        try:
+            self._select_chip(0) # All chips
+            self._set_start(0)
+            for chip in range(3):
+                for page in range(8):
+                    if f.readinto(chunk) != LCD_HEIGHT:
+                        return
+                    self._write_span(chunk, 0, page, chip * LCD_HEIGHT, LCD_HEIGHT)
+            self._select_chip(0)
+            self._write_cmd(LCD_DISPLAY_ON)
+        finally:
+            self._rotation = rotation
+            if f is not source:
+                f.close()
+
+    def save_image( self, filename ):
+        """ Save FrameBuffer as a panel-native image for show_image():
+        64 column bytes for each page of chip 1, then chip 2 and chip 3
+        Args
+        filename (string): filename of image, example: "splash.lcd"
+        """
+        buffer = memoryview(self.buffer)
+        with open(filename, 'wb') as f:
+            for chip in range(3):
+                for page in range(8):
+                    start = page * LCD_WIDTH + chip * LCD_HEIGHT
+                    f.write(buffer[start:start + LCD_HEIGHT])
 
     """ ADDITIONAL FUNCTIONS """
  
+    def push_clip( self, x, y, w, h ):
+        """ Limit drawing to an area inside the current clip area.
+        Honored by draw_text(), draw_bitmap(), draw_bitmap_tran(), draw_vlsb()
+        and load_bmp(); FrameBuffer methods (pixel, line, fill_rect, text ...)
+        are not clipped
+        Args
+        x (int): Start X position
+        y (int): Start Y position
+        w (int): Width of area
+        h (int): Height of area
+        """
+        clip = self._clip
+        self._clips.append(clip)
+        x0 = min(max(x, clip[0]), clip[2])
+        y0 = min(max(y, clip[1]), clip[3])
+        x1 = max(min(x + w, clip[2]), x0)
+        y1 = max(min(y + h, clip[3]), y0)
+        self._clip = bytearray((x0, y0, x1, y1))
+
+    def pop_clip( self ):
+        """ Restore the clip area saved by the last push_clip() """
+        if self._clips:
+            self._clip = self._clips.pop()
+
+    def get_clip( self ):
+        """ Current clip area
+        Return (tuple): x, y, w, h
+        """
+        x0, y0, x1, y1 = self._clip
+        return (x0, y0, x1 - x0, y1 - y0)
+
     def set_font( self, font ):
         """ Set font for text
         Args
         font (module): Font module generated by font_to_py.py
         """
         self._font = font
+        # Fonts generated with font_to_py.py --compress hold PackBits glyphs
+        self._font_packed = hasattr(font, 'compressed') and font.compressed()
 
     def set_text_wrap( self, on = True ):
         """ Set text wrapping """
         self._text_wrap = bool( on )  
 
-    def draw_text( self, text, x, y, color = 1 ):
+    def draw_text( self, text, x, y, color = 1, scale = 1 ):
         """ Draw text on framebuffer
         Args
         x (int) : Start X position
         y (int) : Start Y position
+        color (int): Color 0 or 1
+        scale (int): Integer glyph enlargement, 1..4
         """
         x_start = x
+        clip = self._clip
         screen_height = self.height
         screen_width  = self.width
         wrap = self._text_wrap
@@ -385,88 +591,481 @@ class LCD19264( FrameBuffer ):
             print("Font not set")
             return False
         
-        palette = self._palette
+        packed = self._font_packed
 
         for char in text:   
             glyph = font.get_ch(char)
-            glyph_height = glyph[1]
-            glyph_width  = glyph[2]
+            glyph_height = glyph[1] * scale
+            glyph_width  = glyph[2] * scale
                 
             if wrap and (x + glyph_width > screen_width): # End of row
                 x = x_start
                 y += glyph_height                
             
-            fb = FrameBuffer( bytearray(glyph[0]), glyph_width, glyph_height, MONO_HLSB)
-            if color:
-                self.blit(fb, x, y)
+            if x >= clip[2] or x + glyph_width <= clip[0] or y >= clip[3] or y + glyph_height <= clip[1]:
+                if x >= clip[2] and not wrap: # The rest is right of the clip
+                    break
+            elif scale > 1:
+                scaled = self._scale_glyph(glyph, scale)
+                self._blit_hlsb(scaled, x, y, color, BLIT_OPAQUE, scaled[0])
+            elif packed:
+                self._draw_packed_glyph(glyph[0], x, y, glyph_width, glyph_height, color)
             else:
-                self.blit(fb, x, y, -1, palette)
+                self._blit_hlsb(glyph, x, y, color, BLIT_OPAQUE, glyph[0])
             
             x += glyph_width
 
+    def place_text( self, text, x, y, color = 1, scale = 1 ):
+        """ Draw text that can be changed later by update_text().
+        Uses the font set now, or the built-in 8x8 font if none is set
+        Args
+        text  (string): Text
+        x     (int): Start X position
+        y     (int): Start Y position
+        color (int): Color 0 or 1
+        scale (int): Integer glyph enlargement, 1..4
+        Return (list): Handle for update_text()
+        """
+        handle = ['', x, y, color, scale, self._font, []]
+        self.update_text(handle, text)
+        return handle
+
+    def update_text( self, handle, text ):
+        """ Change placed text, only glyph cells that change are repainted
+        and marked for show_dirty(). Once a glyph width differs, the rest
+        of the text is repainted. Text is not wrapped
+        Args
+        handle (list): Handle from place_text()
+        text   (string): New text
+        """
+        old, x, y, color, scale, font, widths = handle
+        if font is None:
+            height = 8
+        else:
+            height = font.height() * scale
+        current_font = self._font
+        wrap = self._text_wrap
+        if font is not current_font:
+            self.set_font(font)
+        self._text_wrap = False
+
+        new_widths = []
+        shifted = False
+        for i in range(len(text)):
+            char = text[i]
+            width = 8 if font is None else font.get_ch(char)[2] * scale
+            new_widths.append(width)
+            if not shifted and (i >= len(widths) or widths[i] != width):
+                shifted = True
+            if shifted or char != old[i]:
+                if font is None:
+                    self.fill_rect(x, y, 8, 8, 1 - color)
+                    self.text(char, x, y, color)
+                else:
+                    self.draw_text(char, x, y, color, scale)
+                self.mark_dirty(x, y, width, height)
+            x += width
+
+        old_end = handle[1] + sum(widths)
+        if x < old_end: # Text got shorter
+            self.fill_rect(x, y, old_end - x, height, 1 - color)
+            self.mark_dirty(x, y, old_end - x, height)
+
+        if font is not current_font:
+            self.set_font(current_font)
+        self._text_wrap = wrap
+        handle[0] = text
+        handle[6] = new_widths
+
+    @micropython.viper
+    def _draw_packed_glyph( self, data, x:int, y:int, width:int, height:int, color:int ):
+        """ Unpack a PackBits compressed glyph 8 rows at a time and draw
+        every band with _blit_hlsb(). Bands below the clip area are not unpacked
+        Args
+        data   (memoryview): Compressed glyph, horizontally mapped rows
+        x      (int): Start X position
+        y      (int): Start Y position
+        width  (int): Glyph width
+        height (int): Glyph height
+        color  (int): Color 0 or 1
+        """
+        src = ptr8(data)
+        row_bytes = (width + 7) >> 3
+        band_size = row_bytes << 3
+        if int(len(self._band)) < band_size:
+            self._band = bytearray(band_size)
+        band = self._band
+        out = ptr8(band)
+        clip = ptr8(self._clip)
+        clip_y0 = clip[1]
+        clip_y1 = clip[3]
+        total = row_bytes * height
+
+        i = 0     # Position in compressed data
+        n = 0     # Unpacked bytes count
+        k = 0     # Unpacked bytes in current band
+        sy = 0    # Glyph row of current band
+        while n < total:
+            header = src[i]
+            i += 1
+            if header < 128:    # header + 1 literal bytes
+                count = header + 1
+                literal = 1
+                value = 0
+            elif header > 128:  # Next byte repeated 257 - header times
+                count = 257 - header
+                literal = 0
+                value = src[i]
+                i += 1
+            else:
+                continue
+
+            while count > 0 and n < total:
+                if literal:
+                    value = src[i]
+                    i += 1
+                out[k] = value
+                k += 1
+                n += 1
+                count -= 1
+                if k == band_size or n == total: # Band complete
+                    rows = k // row_bytes
+                    if y + sy + rows > clip_y0:
+                        self._blit_hlsb((band, rows, width), x, y + sy, color, BLIT_OPAQUE, band)
+                    sy += rows
+                    k = 0
+                    if y + sy >= clip_y1:
+                        return
+
+    def _scale_lut( self, scale ):
+        """ Bit-doubling table: every byte expanded to scale bytes,
+        each bit repeated scale times (MSB first)
+        Args
+        scale (int): Enlargement factor
+        Return (bytearray): 256 * scale bytes
+        """
+        lut = self._scale_luts.get(scale)
+        if lut is None:
+            lut = bytearray(256 * scale)
+            ones = (1 << scale) - 1
+            for byte in range(256):
+                bits = 0
+                for b in range(8):
+                    if byte & (0x80 >> b):
+                        bits |= ones << ((7 - b) * scale)
+                lut[byte * scale : (byte + 1) * scale] = bits.to_bytes(scale, 'big')
+            self._scale_luts[scale] = lut
+        return lut
+
+    def _scale_glyph( self, glyph, scale ):
+        """ Enlarge a glyph by an integer factor
+        Args
+        glyph (tuple): Result of font.get_ch()
+        scale (int): Enlargement factor
+        Return (tuple): Enlarged glyph data, height, width and bytes per row,
+                        valid until the next call
+        """
+        data, height, width = glyph
+        row_bytes = (width + 7) >> 3
+        if self._font_packed:
+            size = row_bytes * height
+            if len(self._unpacked) < size:
+                self._unpacked = bytearray(size)
+            self._unpack_glyph(data, self._unpacked, size)
+            data = self._unpacked
+
+        size = row_bytes * height * scale * scale
+        if len(self._scaled) < size:
+            self._scaled = bytearray(size)
+        self._expand_rows(data, self._scaled, row_bytes, height, scale, self._scale_lut(scale))
+        return (self._scaled, height * scale, width * scale, row_bytes * scale)
+
     @micropython.viper
-    def draw_bitmap( self, bitmap, x:int, y:int, color:int ):
+    def _expand_rows( self, src, dst, row_bytes:int, height:int, scale:int, lut ):
+        """ Enlarge horizontally mapped rows through the bit-doubling table
+        Args
+        src       (buffer): Glyph data
+        dst       (bytearray): Output, row_bytes * height * scale * scale bytes
+        row_bytes (int): Bytes per glyph row
+        height    (int): Glyph height
+        scale     (int): Enlargement factor
+        lut       (bytearray): Table from _scale_lut()
+        """
+        s = ptr8(src)
+        d = ptr8(dst)
+        table = ptr8(lut)
+        dst_row = row_bytes * scale
+        i = 0
+        o = 0
+        for row in range(height):
+            start = o
+            for b in range(row_bytes):
+                entry = s[i] * scale
+                i += 1
+                for k in range(scale):
+                    d[o] = table[entry + k]
+                    o += 1
+            for r in range(1, scale): # Repeat the enlarged row
+                for k in range(dst_row):
+                    d[o + k] = d[start + k]
+                o += dst_row
+
+    @micropython.viper
+    def _unpack_glyph( self, src, dst, size:int ):
+        """ Unpack a PackBits compressed glyph
+        Args
+        src  (memoryview): Compressed glyph
+        dst  (bytearray): Output buffer
+        size (int): Unpacked glyph size in bytes
+        """
+        s = ptr8(src)
+        d = ptr8(dst)
+        i = 0
+        n = 0
+        while n < size:
+            header = s[i]
+            i += 1
+            if header < 128:    # header + 1 literal bytes
+                count = header + 1
+                while count > 0 and n < size:
+                    d[n] = s[i]
+                    i += 1
+                    n += 1
+                    count -= 1
+            elif header > 128:  # Next byte repeated 257 - header times
+                count = 257 - header
+                value = s[i]
+                i += 1
+                while count > 0 and n < size:
+                    d[n] = value
+                    n += 1
+                    count -= 1
+
+    def draw_bitmap( self, bitmap, x, y, color ):
         """ Draw a bitmap on framebuffer
         Args
-        bitmap (bytes): Bitmap data
+        bitmap (tuple): Bitmap data, height, width
         x      (int): Start X position
         y      (int): Start Y position
         color  (int): Color 0 or 1
         """
-        fb = FrameBuffer( bitmap[0], bitmap[2], bitmap[1], MONO_HLSB )
-        if color:
-            self.blit(fb, x, y)
-        else:            
-            self.blit(fb, x, y, -1, self._palette)
+        self._blit_hlsb(bitmap, x, y, color, BLIT_OPAQUE, bitmap[0])
+
+    def draw_vlsb( self, bitmap, x, y, color = 1 ):
+        """ Draw a bitmap in FrameBuffer page layout (VLSB), as made by
+        tools/img_to_assets.py. Data may be bytes, so frozen bitmaps stay in flash
+        Args
+        bitmap (tuple): Bitmap data, height, width
+        x      (int): Start X position
+        y      (int): Start Y position
+        color  (int): Color 0 or 1
+        """
+        self._blit_vlsb(bitmap[0], x, y, bitmap[2], bitmap[1], color)
+
+    @micropython.viper
+    def _blit_vlsb( self, data, x:int, y:int, width:int, height:int, color:int ):
+        """ Copy VLSB page bytes to FrameBuffer, shifted for unaligned y
+        Args
+        data   (buffer): One run of width bytes per page of bitmap
+        x      (int): Start X position
+        y      (int): Start Y position
+        width  (int): Width of bitmap
+        height (int): Height of bitmap
+        color  (int): Color 0 or 1
+        """
+        src = ptr8(data)
+        buf = ptr8(self.buffer)
+        clip = ptr8(self._clip)
+        shift = y & 7
+        page0 = y >> 3
+        k0 = 0
+        if x < clip[0]:
+            k0 = clip[0] - x
+        k1 = width
+        if x + width > clip[2]:
+            k1 = clip[2] - x
+        if k0 >= k1 or y >= clip[3] or y + height <= clip[1]:
+            return
+
+        for q in range((height + 7) >> 3):
+            lo = page0 + q
+            hi = lo + 1
+            rows = height - (q << 3)
+            select = 0xFF
+            if rows < 8:
+                select = (1 << rows) - 1
+            sel_lo = (select << shift) & 0xFF
+            sel_hi = 0
+            if shift:
+                sel_hi = select >> (8 - shift)
+            sel_lo &= int(self._page_clip(lo))
+            if sel_hi:
+                sel_hi &= int(self._page_clip(hi))
+            if sel_lo == 0 and sel_hi == 0:
+                continue
+            for k in range(k0, k1):
+                value = src[q * width + k]
+                if color == 0:
+                    value = ~value
+                if sel_lo:
+                    i = lo * LCD_WIDTH + x + k
+                    buf[i] = (buf[i] & ~sel_lo) | ((value << shift) & sel_lo)
+                if sel_hi:
+                    i = hi * LCD_WIDTH + x + k
+                    buf[i] = (buf[i] & ~sel_hi) | ((value >> (8 - shift)) & sel_hi)
 
     @micropython.viper
-    def draw_bitmap_tran( self, bitmap, x:int, y:int, color:int ):
+    def _page_clip( self, page:int ) -> int:
+        """ Bits of a FrameBuffer page inside the clip area
+        Args
+        page (int): Page, may be off screen
+        Return (int): Bit mask
+        """
+        clip = ptr8(self._clip)
+        top = page << 3
+        y0 = clip[1] - top
+        y1 = clip[3] - top
+        if y0 < 0:
+            y0 = 0
+        if y1 > 8:
+            y1 = 8
+        if y0 >= y1:
+            return 0
+        return ((1 << y1) - 1) & (0xFF << y0) & 0xFF
+
+    def draw_bitmap_tran( self, bitmap, x, y, color, mask = None ):
         """ Draw a transparent bitmap on display
         Args
-        bitmap (bytes): Bitmap data
+        bitmap (tuple): Bitmap data, height, width
+        x      (int): Start X position
+        y      (int): Start Y position
+        color  (int): Color 0 or 1
+        mask   (tuple): Optional mask bitmap of the same size. Where the mask
+                        is set, bitmap pixels are drawn in color and clear
+                        pixels in the other color; elsewhere the background stays
+        """
+        if mask is None:
+            self._blit_hlsb(bitmap, x, y, color, BLIT_TRAN, bitmap[0])
+        else:
+            self._blit_hlsb(bitmap, x, y, color, BLIT_MASK, mask[0])
+
+    @micropython.viper
+    def _blit_hlsb( self, bitmap, x:int, y:int, color:int, mode:int, mask ):
+        """ Draw a horizontally mapped bitmap on framebuffer byte-wise.
+        Every 8x8 block of the bitmap is transposed into 8 column bytes,
+        which are shifted and merged into one or two pages
+        Args
+        bitmap (tuple): Bitmap data, height, width, optionally bytes per row
         x      (int): Start X position
         y      (int): Start Y position
         color  (int): Color 0 or 1
+        mode   (int): BLIT_TRAN, BLIT_OPAQUE or BLIT_MASK
+        mask   (buffer): Mask data for BLIT_MASK
         """
-        data   = ptr8(bitmap[0]) #memoryview to bitmap
+        data   = ptr8(bitmap[0])
         height = int(bitmap[1])
         width  = int(bitmap[2])
-        
-        i = 0
-        for h in range(height):
-            bit_len = 0
-            while bit_len < width:
-                byte = data[i]
-                xpos = bit_len + x
-                ypos = h + y                
-                #Drawing pixels when bit = 1
-                if (byte >> 7) & 1:
-                    self.pixel(xpos    , ypos, color)
-                if (byte >> 6) & 1:
-                    self.pixel(xpos + 1, ypos, color)
-                if (byte >> 5) & 1:
-                    self.pixel(xpos + 2, ypos, color)
-                if (byte >> 4) & 1:
-                    self.pixel(xpos + 3, ypos, color)
-                if (byte >> 3) & 1:
-                    self.pixel(xpos + 4, ypos, color)
-                if (byte >> 2) & 1:
-                    self.pixel(xpos + 5, ypos, color)
-                if (byte >> 1) & 1:
-                    self.pixel(xpos + 6, ypos, color)
-                if byte & 1:
-                    self.pixel(xpos + 7, ypos, color)
-
-                bit_len += 8
-                i += 1
+        msk    = ptr8(mask)
+        block  = ptr8(self._block)
+        buf    = ptr8(self.buffer)
+
+        clip = ptr8(self._clip)
+        clip_x0 = clip[0]
+        clip_y0 = clip[1]
+        clip_x1 = clip[2]
+        clip_y1 = clip[3]
+        if x >= clip_x1 or x + width <= clip_x0 or y >= clip_y1 or y + height <= clip_y0:
+            return
+
+        row_bytes = (width + 7) >> 3
+        if int(len(bitmap)) > 3:
+            row_bytes = int(bitmap[3])
+        sy = 0
+        if clip_y0 - y >= 8: # Skip bands above the clip area
+            sy = ((clip_y0 - y) >> 3) << 3
+        while sy < height:
+            dy = y + sy
+            if dy >= clip_y1:
+                break
+            rows = height - sy
+            if rows > 8:
+                rows = 8
+            sy += 8
+            if dy + rows <= clip_y0:
+                continue
+
+            # Bits of the column byte inside the clip area
+            valid = (1 << rows) - 1
+            if clip_y0 > dy:
+                valid &= 0xFF << (clip_y0 - dy)
+            if clip_y1 - dy < 8:
+                valid &= (1 << (clip_y1 - dy)) - 1
+            page  = dy >> 3
+            shift = dy & 7
+            lo_offset = page * LCD_WIDTH
+            hi_offset = lo_offset + LCD_WIDTH
 
-    def load_bmp( self, filename, x = 0, y = 0, color = 1 ):
+            src = (sy - 8) * row_bytes
+            for bx in range(row_bytes):
+                x0 = x + (bx << 3)
+                if x0 + 8 <= clip_x0 or x0 >= clip_x1:
+                    continue
+
+                # Fetch 8 rows, skip empty blocks
+                found = 0
+                for j in range(rows):
+                    block[j] = data[src + j * row_bytes + bx]
+                    found |= block[j]
+                if mode == BLIT_MASK:
+                    found = 0
+                    for j in range(rows):
+                        block[8 + j] = msk[src + j * row_bytes + bx]
+                        found |= block[8 + j]
+                if found == 0 and mode != BLIT_OPAQUE:
+                    continue
+
+                for k in range(8):
+                    dx = x0 + k
+                    if dx < clip_x0 or dx >= clip_x1 or (bx << 3) + k >= width:
+                        continue
+                    bit = 0x80 >> k
+                    value = 0  # Transposed column byte
+                    for j in range(rows):
+                        if block[j] & bit:
+                            value |= 1 << j
+
+                    select = valid
+                    if mode == BLIT_TRAN:
+                        select &= value
+                    elif mode == BLIT_MASK:
+                        cover = 0
+                        for j in range(rows):
+                            if block[8 + j] & bit:
+                                cover |= 1 << j
+                        select &= cover
+                    if select == 0:
+                        continue
+                    if color == 0:
+                        value = ~value
+
+                    sel = (select << shift) & 0xFF
+                    if sel:
+                        i = lo_offset + dx
+                        buf[i] = (buf[i] & ~sel) | ((value << shift) & sel)
+                    if shift:
+                        sel = select >> (8 - shift)
+                        if sel:
+                            i = hi_offset + dx
+                            buf[i] = (buf[i] & ~sel) | ((value >> (8 - shift)) & sel)
+
+    def load_bmp( self, filename, x = 0, y = 0, color = 1, rotate = False ):
         """ Load monochromatic BMP image on framebuffer
         Args
         filename (string): filename of image, example: "rain.bmp"
         x (int) : Start X position
         y (int) : Start Y position
         color  (int): Color 0 or 1
+        rotate (bool): Rotate image by 180 degrees
         """
         f = open(filename, 'rb')
 
@@ -480,45 +1079,114 @@ class LCD19264( FrameBuffer ):
             depth    = int.from_bytes(f.read(2), 'little')
             compress = int.from_bytes(f.read(4), 'little')
 
+            if height & 0x80000000: # Negative height: rows stored top-down
+                height -= 0x100000000
+
             if planes == 1 and depth == 1 and compress == 0: #compress method == uncompressed
-                f.seek(offset)
-                
-                self._send_bmp_to_buffer( f, x, y, width, height, color)
+                self._send_bmp_to_buffer( f, offset, x, y, width, height, color, rotate )
             else:
                 print("Unsupported planes, depth, compress:", planes, depth, compress )
                 
         f.close()    
         
-    @micropython.viper
-    def _send_bmp_to_buffer( self, f, x:int, y:int, width:int, height:int, color:int ):
-        """ Send bmp-file to buffer
+    def _send_bmp_to_buffer( self, f, offset, x, y, width, height, color, rotate ):
+        """ Stream bmp-file to buffer in bands of rows landing on one page.
+        Rows outside the clip area are not read
         Args
         f (object File) : Image file
+        offset (int): Position of pixel data in file
         x (int) : Start X position
         y (int) : Start Y position        
         width (int): Width of image frame
-        height (int): Height of image frame
+        height (int): Height of image frame, negative for top-down rows
         color  (int): Color 0 or 1
+        rotate (bool): Rotate image by 180 degrees
         """        
-        block_size = ((width + 31) // 32) * 4  
-        total_size = height * block_size
-        bitmap_size = height * width // 8
-        
-        bitmap = bytearray(bitmap_size)
-        bitmap_buffer = ptr8(bitmap)
-        
-        image_data = f.read(total_size)
-        image_buffer = ptr8(image_data)
-        
-        row_bytes = width // 8
-        for row in range(height): 
-            byte_offset = row_bytes * row 
-            block_offset = block_size * row 
-            for byte in range(row_bytes): 
-                if color == 1:
-                    bitmap_buffer[bitmap_size - 1 - byte_offset - byte] = image_buffer[block_offset + row_bytes - 1 - byte] ^ 0xff
-                else:
-                    bitmap_buffer[bitmap_size - 1 - byte_offset - byte] = image_buffer[block_offset + row_bytes - 1 - byte]
+        top_down = height < 0
+        height = abs(height)
+        block_size = ((width + 31) // 32) * 4 # Rows are padded to 4 bytes
+
+        x0, y0, x1, y1 = self._clip
+        first = max(0, y0 - y) # Visible screen rows of image: first..last-1
+        last = min(height, y1 - y)
+        if first >= last or x >= x1 or x + width <= x0:
+            return
+
+        # File rows go down the screen (forward) or up it
+        forward = top_down != bool(rotate)
+        flags = (1 if color else 0) | (2 if rotate else 0) | (0 if forward else 4)
+        band = memoryview(bytearray(8 * block_size))
+
+        if forward:
+            f.seek(offset + first * block_size)
+            row = first
+        else:
+            f.seek(offset + (height - last) * block_size)
+            row = last
+
+        while True:
+            if forward:
+                top = row
+                row = min(last, ((y + row) | 7) + 1 - y) # End of page
+                bottom = row
+            else:
+                bottom = row
+                row = max(first, ((y + row - 1) & ~7) - y) # Start of page
+                top = row
+            rows = bottom - top
+            f.readinto(band[:rows * block_size])
+            self._bmp_band(band, rows, x, y + top, width, flags)
+            if row == (last if forward else first):
+                break
 
-        fb = FrameBuffer(bitmap, width, height, MONO_HLSB)
-        self.blit(fb, 0, 0)
\ No newline at end of file
+    @micropython.viper
+    def _bmp_band( self, band, rows:int, x:int, y:int, width:int, flags:int ):
+        """ Transpose up to 8 BMP rows straight into one FrameBuffer page
+        Args
+        band   (memoryview): Rows as stored in file, 4-byte padded
+        rows   (int): 1..8 - Number of rows, all on one page
+        x      (int): Start X position
+        y      (int): Screen row of the top row
+        width  (int): Width of image
+        flags  (int): 1 - invert colors, 2 - mirror columns, 4 - rows stored bottom-up
+        """
+        src = ptr8(band)
+        buf = ptr8(self.buffer)
+        block = ptr8(self._block) # Bit for each row, row bytes of 8 columns
+        clip = ptr8(self._clip)
+        clip_x0 = clip[0]
+        clip_x1 = clip[2]
+        stride = ((width + 31) >> 5) << 2
+        invert = flags & 1
+        mirror = flags & 2
+        base = y & 7
+        offset = (y >> 3) * LCD_WIDTH
+        select = ((1 << rows) - 1) << base
+
+        for i in range(rows):
+            if flags & 4:
+                block[i] = 1 << (base + rows - 1 - i)
+            else:
+                block[i] = 1 << (base + i)
+
+        for bx in range((width + 7) >> 3):
+            for i in range(rows):
+                block[8 + i] = src[i * stride + bx]
+            for k in range(8):
+                col = (bx << 3) + k
+                if col >= width:
+                    break
+                if mirror:
+                    dx = x + width - 1 - col
+                else:
+                    dx = x + col
+                if dx < clip_x0 or dx >= clip_x1:
+                    continue
+                bit = 0x80 >> k
+                value = 0
+                for i in range(rows):
+                    if block[8 + i] & bit:
+                        value |= block[i]
+                if invert:
+                    value = ~value
+                buf[offset + dx] = (buf[offset + dx] & ~select) | (value & select)
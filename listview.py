@@ -0,0 +1,232 @@
+"""
+Virtualized list view for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Shows a window of rows of a large source (a list or any object with len()
+and indexing, e.g. a log read from a file). Only visible rows are fetched
+and rendered. Scrolling shifts the pixels already on screen and renders
+only the rows coming into view, and a repainted row is cleared only as
+wide as it was drawn, so memory and time do not grow with the list.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+menu = ListView( lcd, log_entries, rows = 8 )
+menu.draw()
+while True:
+    if button_down():
+        menu.down()
+    lcd.show_dirty()
+"""
+from array import array
+
+LCD_WIDTH   = const(192)
+
+class ListView:
+    def __init__( self, lcd, source, x = 0, y = 0, w = LCD_WIDTH, rows = 8, font = None, row_height = None ):
+        """ ListView constructor
+        Args
+        lcd        (LCD19264): Display
+        source     (sequence): Rows, shown with str()
+        x          (int): Start X position
+        y          (int): Start Y position, multiple of 8
+        w          (int): Width
+        rows       (int): Number of visible rows
+        font       (module): Font module from font_to_py.py, None - built-in 8x8 font
+        row_height (int): Height of a row, by default the font height
+        """
+        if y & 7:
+            raise ValueError( "ListView must be page aligned" )
+        self.lcd = lcd
+        self.source = source
+        self.x = x
+        self.y = y
+        self.w = w
+        self.rows = rows
+        self.font = font
+        if row_height is None:
+            row_height = font.height() if font else 8
+        self.row_height = row_height
+        self.h = rows * row_height
+        self.top = 0       # Index of the first visible row
+        self.selected = 0  # Index of the selected row, -1 - none
+        # Drawn width of every visible row, by position on screen
+        self._widths = array('H', bytes(2 * rows))
+        self._drawn = False
+
+    def __len__( self ):
+        return len(self.source)
+
+    def set_source( self, source ):
+        """ Show another source from its first row """
+        self.source = source
+        self.top = 0
+        self.selected = 0 if self.selected >= 0 else -1
+        self.draw()
+
+    def draw( self ):
+        """ Render all visible rows """
+        self.lcd.fill_rect(self.x, self.y, self.w, self.h, 0)
+        for slot in range(self.rows):
+            self._widths[slot] = 0
+            self._render(slot)
+        self.lcd.mark_dirty(self.x, self.y, self.w, self.h)
+        self._drawn = True
+
+    def refresh( self, index ):
+        """ Render a row again after its data changed, if it is visible """
+        slot = index - self.top
+        if self._drawn and 0 <= slot < self.rows:
+            self._render(slot)
+
+    def scroll_to( self, top ):
+        """ Show rows from top. Pixels on screen are shifted, only rows
+        coming into view are rendered
+        Args
+        top (int): Index of the first visible row
+        """
+        top = max(0, min(top, len(self.source) - self.rows))
+        delta = top - self.top
+        if delta == 0:
+            return
+        self.top = top
+        rows = self.rows
+        if not self._drawn or abs(delta) >= rows:
+            self.draw()
+            return
+
+        self._shift(delta * self.row_height)
+        widths = self._widths
+        if delta > 0:
+            for slot in range(rows - delta):
+                widths[slot] = widths[slot + delta]
+            new = range(rows - delta, rows)
+        else:
+            for slot in range(rows - 1, -delta - 1, -1):
+                widths[slot] = widths[slot + delta]
+            new = range(0, -delta)
+        for slot in new:
+            widths[slot] = self.w # Holds shifted pixels of unknown width
+            self._render(slot)
+        self.lcd.mark_dirty(self.x, self.y, self.w, self.h)
+
+    def scroll( self, rows ):
+        """ Scroll by a number of rows, positive - down the list """
+        self.scroll_to(self.top + rows)
+
+    def select( self, index ):
+        """ Select a row and scroll it into view
+        Args
+        index (int): Row index, -1 - no selection
+        """
+        index = min(index, len(self.source) - 1)
+        if index < -1:
+            index = -1
+        old = self.selected
+        if index == old:
+            return
+        self.selected = index
+        if index >= 0:
+            if index < self.top:
+                self.scroll_to(index)
+            elif index >= self.top + self.rows:
+                self.scroll_to(index - self.rows + 1)
+        if self._drawn:
+            self.refresh(old)
+            self.refresh(index)
+
+    def up( self ):
+        if self.selected > 0:
+            self.select(self.selected - 1)
+
+    def down( self ):
+        self.select(self.selected + 1)
+
+    def _fit( self, text ):
+        """ Cut text to the width of the view
+        Return (tuple): Text and its width
+        """
+        font = self.font
+        width = 0
+        for i in range(len(text)):
+            w = 8 if font is None else font.get_ch(text[i])[2]
+            if width + w > self.w:
+                return text[:i], width
+            width += w
+        return text, width
+
+    def _render( self, slot ):
+        """ Render the row shown at a position on screen """
+        lcd = self.lcd
+        index = self.top + slot
+        y = self.y + slot * self.row_height
+        if index < len(self.source):
+            text, width = self._fit(str(self.source[index]))
+        else:
+            text, width = "", 0
+        selected = index == self.selected
+        # Clear only as wide as drawn before, unless the row is inverted
+        clear = self.w if selected else max(width, self._widths[slot])
+        lcd.fill_rect(self.x, y, clear, self.row_height, 1 if selected else 0)
+        color = 0 if selected else 1
+        if self.font is None:
+            lcd.text(text, self.x, y, color)
+        elif text:
+            current_font = lcd._font
+            lcd.set_font(self.font)
+            lcd.draw_text(text, self.x, y, color)
+            lcd.set_font(current_font)
+        lcd.mark_dirty(self.x, y, clear, self.row_height)
+        self._widths[slot] = self.w if selected else width
+
+    @micropython.viper
+    def _shift( self, dy:int ):
+        """ Move the pixels of the view up by dy pixels (down if negative).
+        Pixels below the view on its last page are kept
+        Args
+        dy (int): Movement in pixels
+        """
+        buf = ptr8(self.lcd.buffer)
+        x0 = int(self.x)
+        x1 = x0 + int(self.w)
+        if x0 < 0:
+            x0 = 0
+        if x1 > LCD_WIDTH:
+            x1 = LCD_WIDTH
+        height = int(self.h)
+        pages = (height + 7) >> 3
+        page0 = int(self.y) >> 3
+        last_mask = 0xFF
+        if height & 7:
+            last_mask = (1 << (height & 7)) - 1
+        if page0 + pages > 8: # View goes below the screen
+            pages = 8 - page0
+            last_mask = 0xFF
+        dpages = dy >> 3
+        shift = dy & 7
+
+        # Copy in the direction that reads pixels before they are overwritten
+        if dy >= 0:
+            p = 0
+            p_end = pages
+            p_step = 1
+        else:
+            p = pages - 1
+            p_end = -1
+            p_step = -1
+
+        while p != p_end:
+            q = p + dpages
+            mask = 0xFF
+            if p == pages - 1:
+                mask = last_mask
+            out = (page0 + p) * LCD_WIDTH
+            for c in range(x0, x1):
+                value = 0
+                if q >= 0 and q < pages:
+                    value = buf[(page0 + q) * LCD_WIDTH + c] >> shift
+                if shift and q + 1 >= 0 and q + 1 < pages:
+                    value |= buf[(page0 + q + 1) * LCD_WIDTH + c] << (8 - shift)
+                buf[out + c] = (buf[out + c] & (0xFF ^ mask)) | (value & mask)
+            p += p_step
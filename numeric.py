@@ -0,0 +1,216 @@
+"""
+Numeric glyph atlas for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Digits, sign, decimal point and unit characters of a font are rendered
+once into page strips in the layout of the FrameBuffer (VLSB). A number
+is then split into digits arithmetically, without building strings, and
+every glyph is copied column by column; at a page aligned y that is one
+byte store per column and page. Digits sit in cells of equal width and
+numbers are right aligned, so a changing readout never jitters.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+atlas = NumberAtlas( lcd, LibreBodoni24, units = "C%" )
+temp = atlas.format( decimals = 1, width = 5, unit = "C" )
+while True:
+    atlas.draw_number( read_temp(), 0, 8, temp )
+    lcd.show_dirty()
+"""
+from framebuf import FrameBuffer, MONO_VLSB, MONO_HLSB
+
+LCD_WIDTH   = const(192)
+LCD_HEIGHT  = const(64)
+
+DIGITS_MAX  = const(24) # Cells of one number
+BLANK       = const(0xFF)
+MINUS       = const(10)
+POINT       = const(11)
+UNITS       = const(12) # Index of the first unit character
+
+class NumberAtlas:
+    def __init__( self, lcd, font, units = "" ):
+        """ NumberAtlas constructor, renders the glyphs
+        Args
+        lcd   (LCD19264): Display
+        font  (module): Font module generated by font_to_py.py
+        units (string): Unit characters to render, example: "C%V"
+        """
+        self.lcd = lcd
+        self.units = units
+        self.height = font.height()
+        self.pages = (self.height + 7) >> 3
+        chars = "0123456789-." + units
+        glyphs = [font.get_ch(char) for char in chars]
+        packed = hasattr(font, 'compressed') and font.compressed()
+
+        self.stride = sum(glyph[2] for glyph in glyphs) # Bytes per page of strips
+        self.strips = bytearray(self.stride * self.pages)
+        self.offsets = bytearray(2 * len(chars)) # Strip offset of every glyph
+        self.widths = bytearray(len(chars))
+        atlas = FrameBuffer(self.strips, self.stride, self.height, MONO_VLSB)
+        offset = 0
+        for i in range(len(chars)):
+            data, height, width = glyphs[i]
+            row_bytes = (width + 7) >> 3
+            if packed:
+                unpacked = bytearray(row_bytes * height)
+                lcd._unpack_glyph(data, unpacked, len(unpacked))
+                data = unpacked
+            atlas.blit(FrameBuffer(bytearray(data), width, height, MONO_HLSB), offset, 0)
+            self.offsets[2 * i] = offset & 0xFF
+            self.offsets[2 * i + 1] = offset >> 8
+            self.widths[i] = width
+            offset += width
+
+        # Every cell but the point has the width of the widest digit
+        self.cell = max(self.widths[0:MINUS + 1])
+        self._codes = bytearray(DIGITS_MAX) # Glyph indexes, right to left
+        self._color = 1
+
+    def format( self, decimals = 0, width = 0, unit = None ):
+        """ Prepare a number format once, to pass it to draw_number()
+        Args
+        decimals (int): Digits after the point
+        width    (int): Cells of the field (digits, sign and point), the
+                        number is right aligned. 0 - as many as needed
+        unit     (string): Unit character from units, None - no unit
+        Return (tuple): Format
+        """
+        code = BLANK if unit is None else UNITS + self.units.index(unit)
+        return (decimals, width, code, 10 ** decimals)
+
+    def draw_number( self, value, x, y, fmt = (0, 0, BLANK, 1), color = 1 ):
+        """ Draw a number and mark it for show_dirty()
+        Args
+        value (int or float): Number
+        x     (int): Start X position of the field
+        y     (int): Start Y position
+        fmt   (tuple): Format from format()
+        color (int): Color 0 or 1
+        Return (int): Width of the field in pixels
+        """
+        decimals, width, unit, scale = fmt
+        if isinstance(value, int):
+            number = value * scale
+        elif value < 0: # Round half away from zero
+            number = int(value * scale - 0.5)
+        else:
+            number = int(value * scale + 0.5)
+        self._color = color
+        count = self._fill_codes(number, decimals, width, unit)
+        return self._draw_codes(count, x, y)
+
+    @micropython.viper
+    def _fill_codes( self, number:int, decimals:int, width:int, unit:int ) -> int:
+        """ Split a number into glyph indexes, right to left
+        Return (int): Number of codes
+        """
+        codes = ptr8(self._codes)
+        n = 0
+        if unit != BLANK:
+            codes[0] = unit
+            n = 1
+        first = n
+        negative = number < 0
+        if negative:
+            number = 0 - number
+        k = 0
+        while (number != 0 or k <= decimals) and n < DIGITS_MAX - 1:
+            if decimals and k == decimals:
+                codes[n] = POINT
+                n += 1
+            codes[n] = number % 10
+            number //= 10
+            n += 1
+            k += 1
+        if negative and n < DIGITS_MAX:
+            codes[n] = MINUS
+            n += 1
+        while n - first < width and n < DIGITS_MAX:
+            codes[n] = BLANK
+            n += 1
+        return n
+
+    def _draw_codes( self, count, x, y ):
+        """ Draw glyphs of codes from left to right
+        Return (int): Width drawn in pixels
+        """
+        codes = self._codes
+        offsets = self.offsets
+        widths = self.widths
+        cell = self.cell
+        start = x
+        for i in range(count - 1, -1, -1):
+            code = codes[i]
+            if code == BLANK:
+                self._blit(0, 0, cell, x, y)
+                x += cell
+            else:
+                width = widths[code]
+                offset = offsets[2 * code] | (offsets[2 * code + 1] << 8)
+                step = width if code == POINT or code >= UNITS else cell
+                self._blit(offset, width, step, x, y)
+                x += step
+        self.lcd.mark_dirty(start, y, x - start, self.height)
+        return x - start
+
+    @micropython.viper
+    def _blit( self, offset:int, width:int, cell:int, x:int, y:int ):
+        """ Copy a glyph from the strips into a cell of FrameBuffer,
+        columns of the cell right of the glyph are cleared
+        Args
+        offset (int): Strip offset of the glyph
+        width  (int): Glyph width
+        cell   (int): Cell width
+        x      (int): Start X position
+        y      (int): Start Y position
+        """
+        strips = ptr8(self.strips)
+        buf = ptr8(self.lcd.buffer)
+        stride = int(self.stride)
+        height = int(self.height)
+        invert = 0
+        if int(self._color) == 0:
+            invert = 0xFF
+        shift = y & 7
+        page0 = y >> 3
+        k0 = 0
+        if x < 0:
+            k0 = 0 - x
+        k1 = cell
+        if x + cell > LCD_WIDTH:
+            k1 = LCD_WIDTH - x
+
+        for q in range((height + 7) >> 3):
+            lo = page0 + q
+            hi = lo + 1
+            rows = height - (q << 3)
+            select = 0xFF
+            if rows < 8:
+                select = (1 << rows) - 1
+            sel_lo = (select << shift) & 0xFF
+            sel_hi = 0
+            if shift:
+                sel_hi = select >> (8 - shift)
+            if lo < 0 or lo >= 8:
+                sel_lo = 0
+            if hi < 0 or hi >= 8:
+                sel_hi = 0
+            src = q * stride + offset
+            out = lo * LCD_WIDTH + x
+            for k in range(k0, k1):
+                value = invert
+                if k < width:
+                    value = strips[src + k] ^ invert
+                if sel_lo == 0xFF: # Page aligned: straight copy
+                    buf[out + k] = value
+                else:
+                    if sel_lo:
+                        i = out + k
+                        buf[i] = (buf[i] & (0xFF ^ sel_lo)) | ((value << shift) & sel_lo)
+                    if sel_hi:
+                        i = out + LCD_WIDTH + k
+                        buf[i] = (buf[i] & (0xFF ^ sel_hi)) | ((value >> (8 - shift)) & sel_hi)
@@ -0,0 +1,168 @@
+"""
+Screen cache for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Keeps snapshots of rendered screens, so switching back to one is a copy
+of pages instead of drawing it again. A snapshot holds the whole
+FrameBuffer or only the pages that differ from a base screen. Snapshots
+live in RAM or in files; the least recently used one is dropped when the
+pool is full. Showing a snapshot sends only the pages that differ from
+the screen shown now.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+cache = ScreenCache( lcd, capacity = 6 )
+def show_screen( name ):
+    if not cache.show( name ):
+        draw_screen( name )
+        cache.store( name )
+        lcd.show()
+"""
+import os
+
+LCD_WIDTH   = const(192)
+LCD_PAGES   = const(8)
+
+class ScreenCache:
+    def __init__( self, lcd, capacity = 4, path = None ):
+        """ ScreenCache constructor
+        Args
+        lcd      (LCD19264): Display
+        capacity (int): Most snapshots kept
+        path     (string): Folder to keep snapshots in files, None - in RAM
+        """
+        self.lcd = lcd
+        self.capacity = capacity
+        self.path = path
+        self._entries = {} # Key: (page mask, data or None for files)
+        self._order = []   # Keys, least recently used first
+        self._base = None
+        self._page = bytearray(LCD_WIDTH)
+        if path:
+            try:
+                os.mkdir(path)
+            except OSError:
+                pass
+
+    def _file( self, key ):
+        return "{}/{}.scr".format(self.path, key)
+
+    def set_base( self ):
+        """ Take the FrameBuffer as base screen for diff snapshots.
+        Diff snapshots of another base are dropped
+        """
+        for key in list(self._entries):
+            if self._entries[key][0] != 0xFF:
+                self.invalidate(key)
+        self._base = bytes(self.lcd.buffer)
+
+    def store( self, key, diff = False ):
+        """ Snapshot the FrameBuffer
+        Args
+        key  (string): Name of the screen
+        diff (bool): Keep only pages that differ from the base screen
+        """
+        self.invalidate(key)
+        buffer = self.lcd.buffer
+        mask = 0xFF
+        if diff and self._base:
+            mask = 0
+            base = self._base
+            for page in range(LCD_PAGES):
+                start = page * LCD_WIDTH
+                if buffer[start:start + LCD_WIDTH] != base[start:start + LCD_WIDTH]:
+                    mask |= 1 << page
+        data = bytearray()
+        for page in range(LCD_PAGES):
+            if mask & (1 << page):
+                data += buffer[page * LCD_WIDTH:(page + 1) * LCD_WIDTH]
+        if self.path:
+            with open(self._file(key), 'wb') as f:
+                f.write(bytes((mask,)))
+                f.write(data)
+            data = None
+        self._entries[key] = (mask, data)
+        self._order.append(key)
+        while len(self._order) > self.capacity:
+            self.invalidate(self._order[0])
+
+    def __contains__( self, key ):
+        return key in self._entries
+
+    def show( self, key ):
+        """ Put a snapshot on FrameBuffer and send the pages that changed
+        Args
+        key (string): Name of the screen
+        Return (bool): False if the screen is not cached
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        self._order.remove(key)
+        self._order.append(key)
+        mask, data = entry
+        lcd = self.lcd
+        f = open(self._file(key), 'rb') if data is None else None
+        try:
+            if f:
+                f.seek(1)
+            offset = 0
+            for page in range(LCD_PAGES):
+                if mask & (1 << page):
+                    if f:
+                        f.readinto(self._page)
+                        changed = self._copy_page(self._page, 0, page)
+                    else:
+                        changed = self._copy_page(data, offset, page)
+                    offset += LCD_WIDTH
+                elif self._base:
+                    changed = self._copy_page(self._base, page * LCD_WIDTH, page)
+                else:
+                    changed = 0
+                if changed:
+                    lcd.mark_dirty(0, page * 8, LCD_WIDTH, 8)
+        finally:
+            if f:
+                f.close()
+        lcd.show_dirty()
+        return True
+
+    def invalidate( self, key = None ):
+        """ Drop a snapshot whose screen changed
+        Args
+        key (string): Name of the screen, None - all
+        """
+        if key is None:
+            for key in list(self._entries):
+                self.invalidate(key)
+            return
+        if key in self._entries:
+            del self._entries[key]
+            self._order.remove(key)
+            if self.path:
+                try:
+                    os.remove(self._file(key))
+                except OSError:
+                    pass
+
+    @micropython.viper
+    def _copy_page( self, src, offset:int, page:int ) -> int:
+        """ Copy a page to FrameBuffer
+        Args
+        src    (buffer): Page data
+        offset (int): Position of the page in src
+        page   (int): 0..7 - FrameBuffer page
+        Return (int): 1 if the page changed
+        """
+        s = ptr8(src)
+        buf = ptr8(self.lcd.buffer)
+        out = page * LCD_WIDTH
+        changed = 0
+        for x in range(LCD_WIDTH):
+            value = s[offset + x]
+            if buf[out + x] != value:
+                buf[out + x] = value
+                changed = 1
+        return changed
@@ -0,0 +1,243 @@
+"""
+Sprites for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Sprites are precompiled to the vertical layout of the FrameBuffer (VLSB),
+so drawing one costs a shift and a masked merge per column byte. Every
+sprite saves the background it covers and puts it back when it moves,
+so the screen behind sprites survives and only touched pages are sent.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+sprites = Sprites( lcd )
+ball = sprites.add( Sprite( bitmaps.drop, x = 10, y = 10 ) )
+while True:
+    ball.move( ball.x + 1, ball.y )
+    sprites.update()
+    lcd.show_dirty()
+"""
+from framebuf import FrameBuffer, MONO_VLSB, MONO_HLSB
+
+LCD_WIDTH   = const(192)
+LCD_PAGES   = const(8)
+
+def to_vlsb( bitmap ):
+    """ Convert a bitmap to VLSB layout
+    Args
+    bitmap (tuple): HLSB bitmap data, height, width (as in bitmaps.py)
+    Return (bytearray): One run of width bytes per page of bitmap
+    """
+    data, height, width = bitmap
+    vlsb = bytearray( width * ((height + 7) >> 3) )
+    src = FrameBuffer( bytearray(data), width, height, MONO_HLSB )
+    FrameBuffer( vlsb, width, height, MONO_VLSB ).blit( src, 0, 0 )
+    return vlsb
+
+class Sprite:
+    def __init__( self, bitmap, mask = None, x = 0, y = 0, z = 0, color = 1 ):
+        """ Sprite constructor
+        Args
+        bitmap (tuple): HLSB bitmap data, height, width
+        mask   (tuple): Optional mask bitmap of the same size. Without mask
+                        only set pixels are drawn, with mask all pixels under it
+        x      (int): Start X position
+        y      (int): Start Y position
+        z      (int): Z-order, higher is drawn on top
+        color  (int): Color 0 or 1
+        """
+        self.height = bitmap[1]
+        self.width  = bitmap[2]
+        self.pages  = (self.height + 7) >> 3
+        self.x = x
+        self.y = y
+        self.z = z
+        self.color = color
+        self.visible = True
+        self._set_data( bitmap, mask )
+
+        # Background under the sprite, one page more for unaligned y
+        self._under = bytearray( self.width * (self.pages + 1) )
+        self._drawn = False   # Sprite is drawn on FrameBuffer
+        self._shown = False   # Sprite was visible at last update
+        self._drawn_x = 0     # Position the sprite was drawn at
+        self._drawn_y = 0
+        self._changed = True
+
+    def _set_data( self, bitmap, mask ):
+        """ Precompile image and mask """
+        self.image = to_vlsb( bitmap )
+        self.mask  = to_vlsb( mask ) if mask else self.image
+
+    def move( self, x, y ):
+        """ Move sprite, takes effect on Sprites.update()
+        Args
+        x (int): New X position
+        y (int): New Y position
+        """
+        if x != self.x or y != self.y:
+            self.x = x
+            self.y = y
+            self._changed = True
+
+    def set_visible( self, visible = True ):
+        """ Show or hide sprite """
+        visible = bool( visible )
+        if visible != self.visible:
+            self.visible = visible
+            self._changed = True
+
+    def set_image( self, bitmap, mask = None ):
+        """ Replace sprite image by another of the same size
+        Args
+        bitmap (tuple): HLSB bitmap data, height, width
+        mask   (tuple): Optional mask bitmap
+        """
+        if bitmap[1] != self.height or bitmap[2] != self.width:
+            raise ValueError( "Sprite size can't change" )
+        self._set_data( bitmap, mask )
+        self._changed = True
+
+    @micropython.viper
+    def _swap_under( self, buffer, restore:int ):
+        """ Save or restore the background under the sprite
+        Args
+        buffer  (bytearray): FrameBuffer data
+        restore (int): 0 - save background, 1 - restore it
+        """
+        buf   = ptr8(buffer)
+        under = ptr8(self._under)
+        width = int(self.width)
+        x = int(self._drawn_x)
+        y = int(self._drawn_y)
+        pages = int(self.pages)
+        if y & 7:
+            pages += 1
+        page0 = y >> 3
+
+        for q in range(pages):
+            page = page0 + q
+            if page < 0 or page >= LCD_PAGES:
+                continue
+            for k in range(width):
+                col = x + k
+                if col < 0 or col >= LCD_WIDTH:
+                    continue
+                i = page * LCD_WIDTH + col
+                if restore:
+                    buf[i] = under[q * width + k]
+                else:
+                    under[q * width + k] = buf[i]
+
+    @micropython.viper
+    def _draw( self, buffer ):
+        """ Merge the sprite into FrameBuffer at its drawn position
+        Args
+        buffer (bytearray): FrameBuffer data
+        """
+        buf   = ptr8(buffer)
+        image = ptr8(self.image)
+        mask  = ptr8(self.mask)
+        width = int(self.width)
+        color = int(self.color)
+        x = int(self._drawn_x)
+        y = int(self._drawn_y)
+        shift = y & 7
+        page0 = y >> 3
+
+        for q in range(int(self.pages)):
+            lo = page0 + q
+            hi = lo + 1
+            for k in range(width):
+                col = x + k
+                if col < 0 or col >= LCD_WIDTH:
+                    continue
+                j = q * width + k
+                select = mask[j]
+                if select == 0:
+                    continue
+                value = image[j]
+                if color == 0:
+                    value = ~value
+
+                if lo >= 0 and lo < LCD_PAGES:
+                    sel = (select << shift) & 0xFF
+                    if sel:
+                        i = lo * LCD_WIDTH + col
+                        buf[i] = (buf[i] & ~sel) | ((value << shift) & sel)
+                if shift and hi >= 0 and hi < LCD_PAGES:
+                    sel = select >> (8 - shift)
+                    if sel:
+                        i = hi * LCD_WIDTH + col
+                        buf[i] = (buf[i] & ~sel) | ((value >> (8 - shift)) & sel)
+
+class Sprites:
+    def __init__( self, lcd ):
+        """ Z-ordered set of sprites drawn over the FrameBuffer
+        Args
+        lcd (LCD19264): Display
+        """
+        self.lcd = lcd
+        self._sprites = []
+        self._drawn = False
+
+    def add( self, sprite ):
+        """ Add a sprite, drawn on the next update()
+        Return (Sprite): The sprite
+        """
+        self.erase()
+        self._sprites.append( sprite )
+        self._sprites.sort( key = lambda s: s.z )
+        sprite._changed = True
+        return sprite
+
+    def remove( self, sprite ):
+        """ Remove a sprite, its background is restored on the next update() """
+        self.erase()
+        self._sprites.remove( sprite )
+        if sprite._shown:
+            self.lcd.mark_dirty( sprite._drawn_x, sprite._drawn_y, sprite.width, sprite.height )
+            sprite._shown = False
+
+    def set_z( self, sprite, z ):
+        """ Change z-order of a sprite """
+        self.erase()
+        sprite.z = z
+        sprite._changed = True
+        self._sprites.sort( key = lambda s: s.z )
+
+    def erase( self ):
+        """ Restore the background under all sprites. Draw on the
+        background after erase(), then call update()
+        """
+        if self._drawn:
+            buffer = self.lcd.buffer
+            for sprite in reversed( self._sprites ): # Top-most first
+                if sprite._drawn:
+                    sprite._swap_under( buffer, 1 )
+                    sprite._drawn = False
+            self._drawn = False
+
+    def update( self ):
+        """ Redraw sprites at their new positions and mark the areas
+        they left or entered for LCD19264.show_dirty()
+        """
+        lcd = self.lcd
+        buffer = lcd.buffer
+        self.erase()
+        for sprite in self._sprites:
+            if sprite._changed:
+                if sprite._shown: # Area left
+                    lcd.mark_dirty( sprite._drawn_x, sprite._drawn_y, sprite.width, sprite.height )
+                if sprite.visible: # Area entered
+                    lcd.mark_dirty( sprite.x, sprite.y, sprite.width, sprite.height )
+                sprite._shown = sprite.visible
+                sprite._changed = False
+            if sprite.visible:
+                sprite._drawn_x = sprite.x
+                sprite._drawn_y = sprite.y
+                sprite._swap_under( buffer, 0 )
+                sprite._draw( buffer )
+                sprite._drawn = True
+        self._drawn = True
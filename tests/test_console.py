@@ -0,0 +1,49 @@
+"""
+Test of Console scrolling with a limited flush. Run on the board with the
+display connected and console.py, LibreBodoni20.py on it
+"""
+from lcd19264 import LCD19264
+from console import Console
+import LibreBodoni20 as MY_FONT
+
+# Set pins here
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+
+def pending( con, page ):
+    return con._pending[page * 2] < con._pending[page * 2 + 1]
+
+def fill_screen( con ):
+    for i in range(con.rows - 1):
+        con.write("line %d\n" % i)
+    con.write("last")
+    con.flush()
+
+# One page per line: the page scrolled in is sent first, then the start line moves
+con = Console(lcd, cursor = False)
+fill_screen(con)
+con.row = 1
+con.col = 0
+con.write("edit") # A pending page near the top
+con.row = con.rows - 1
+con.write("\nnew") # Scroll
+bottom = con._page(con.rows - 1)
+con.flush(max_pages = 1)
+assert not pending(con, bottom)
+assert con._start == con._start_line()
+con.flush()
+
+# Four pages per line: the start line waits until all of them are sent
+con = Console(lcd, MY_FONT, cursor = False)
+assert con.line_pages == 4
+fill_screen(con)
+con.write("\nnew") # Scroll
+for i in range(con.line_pages - 1):
+    con.flush(max_pages = 1)
+    assert con._start != con._start_line()
+con.flush(max_pages = 1)
+assert con._start == con._start_line()
+for page in range(8):
+    assert not pending(con, page)
+
+print("test_console ok")
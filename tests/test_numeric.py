@@ -0,0 +1,32 @@
+"""
+Test of NumberAtlas rounding. Run on the board with the display connected
+and numeric.py, LibreBodoni24.py on it
+"""
+from lcd19264 import LCD19264
+from numeric import NumberAtlas
+import LibreBodoni24 as MY_FONT
+
+# Set pins here
+lcd = LCD19264(rs = 1, rw = 2, en = 3, rst = 13, cs1 = 12, cs2 = 14, cs3 = 15,
+                  db0 = 4, db1 = 5, db2 = 6, db3 = 7, db4 = 8, db5 = 9, db6 = 10, db7 = 11)
+
+atlas = NumberAtlas(lcd, MY_FONT)
+
+def drawn( value, fmt ):
+    lcd.fill(0)
+    atlas.draw_number(value, 0, 8, fmt)
+    return bytes(lcd.buffer)
+
+# Floats round half away from zero for any number of decimals
+whole = atlas.format(decimals = 0, width = 4)
+assert drawn(2.7, whole) == drawn(3, whole)
+assert drawn(2.2, whole) == drawn(2, whole)
+assert drawn(-2.7, whole) == drawn(-3, whole)
+assert drawn(-2.5, whole) == drawn(-3, whole)
+assert drawn(-0.2, whole) == drawn(0, whole)
+
+tenths = atlas.format(decimals = 1, width = 4)
+assert drawn(2.76, tenths) == drawn(2.8, tenths)
+assert drawn(-2.76, tenths) == drawn(-2.8, tenths)
+
+print("test_numeric ok")
@@ -0,0 +1,211 @@
+"""
+Tilemap layer for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+A tile is 8x8 pixels stored as 8 VLSB column bytes, so a tile row aligned
+to a page is a straight copy of bytes into the FrameBuffer. The map may be
+much larger than the screen; a viewport shows part of it. Scrolling moves
+the pixels already on screen and renders only the tiles scrolled into view.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+world = Tilemap( lcd, tiles, level, 64 ) # level: bytearray of 64 x 8 tiles
+world.draw()
+for x in range(0, 64 * 8 - 192):
+    world.scroll_to( x, 0 )
+    lcd.show_dirty()
+"""
+from sprite import to_vlsb
+
+LCD_WIDTH   = const(192)
+LCD_HEIGHT  = const(64)
+
+def make_tiles( bitmaps ):
+    """ Build a tileset from 8x8 bitmaps
+    Args
+    bitmaps (list): HLSB bitmaps (data, height, width) as in bitmaps.py
+    Return (bytearray): 8 VLSB bytes per tile
+    """
+    tiles = bytearray()
+    for bitmap in bitmaps:
+        if bitmap[1] != 8 or bitmap[2] != 8:
+            raise ValueError( "Tiles must be 8x8" )
+        tiles += to_vlsb( bitmap )
+    return tiles
+
+class Tilemap:
+    def __init__( self, lcd, tiles, map_data, map_width, x = 0, y = 0, width = LCD_WIDTH, height = LCD_HEIGHT ):
+        """ Tilemap constructor
+        Args
+        lcd       (LCD19264): Display
+        tiles     (buffer): Tileset, 8 VLSB bytes per tile
+        map_data  (bytearray): Tile numbers, row by row
+        map_width (int): Map width in tiles
+        x         (int): Viewport X position on screen
+        y         (int): Viewport Y position on screen, multiple of 8
+        width     (int): Viewport width
+        height    (int): Viewport height, multiple of 8
+        """
+        if x < 0 or x + width > LCD_WIDTH or y < 0 or y + height > LCD_HEIGHT or (y | height) & 7:
+            raise ValueError( "Viewport must be on screen and page aligned" )
+        self.lcd = lcd
+        self.tiles = tiles
+        self.map = map_data
+        self.map_width = map_width
+        self.map_height = len( map_data ) // map_width
+        self.x = x
+        self.page = y >> 3
+        self.width = width
+        self.height = height
+        self.pages = height >> 3
+        self.scroll_x = 0
+        self.scroll_y = 0
+        self._drawn = False
+
+    def draw( self ):
+        """ Render the whole viewport """
+        self._render( 0, self.width, 0, self.pages )
+        self.lcd.mark_dirty( self.x, self.page << 3, self.width, self.height )
+        self._drawn = True
+
+    def scroll_to( self, x, y ):
+        """ Move the viewport over the map. Pixels on screen are moved,
+        only tiles coming into view are rendered
+        Args
+        x (int): Map X position of the viewport
+        y (int): Map Y position of the viewport
+        """
+        x = max( 0, min( x, self.map_width * 8 - self.width ) )
+        y = max( 0, min( y, self.map_height * 8 - self.height ) )
+        dx = x - self.scroll_x
+        dy = y - self.scroll_y
+        if dx == 0 and dy == 0:
+            return
+        self.scroll_x = x
+        self.scroll_y = y
+        if not self._drawn or abs( dx ) >= self.width or abs( dy ) >= self.height:
+            self.draw()
+            return
+
+        self._shift( dx, dy )
+        width = self.width
+        pages = self.pages
+        if dx > 0:
+            self._render( width - dx, width, 0, pages )
+        elif dx < 0:
+            self._render( 0, -dx, 0, pages )
+        if dy > 0:
+            self._render( 0, width, (self.height - dy) >> 3, pages )
+        elif dy < 0:
+            self._render( 0, width, 0, ((-dy - 1) >> 3) + 1 )
+        self.lcd.mark_dirty( self.x, self.page << 3, width, self.height )
+
+    def scroll( self, dx, dy ):
+        """ Move the viewport relative to its position """
+        self.scroll_to( self.scroll_x + dx, self.scroll_y + dy )
+
+    def set_tile( self, col, row, tile ):
+        """ Change a tile on the map, rendered at once if in view
+        Args
+        col  (int): Map column
+        row  (int): Map row
+        tile (int): Tile number
+        """
+        self.map[row * self.map_width + col] = tile
+        if not self._drawn:
+            return
+        x0 = max( col * 8 - self.scroll_x, 0 )
+        x1 = min( col * 8 + 8 - self.scroll_x, self.width )
+        y0 = max( row * 8 - self.scroll_y, 0 )
+        y1 = min( row * 8 + 8 - self.scroll_y, self.height )
+        if x0 < x1 and y0 < y1:
+            self._render( x0, x1, y0 >> 3, ((y1 - 1) >> 3) + 1 )
+            self.lcd.mark_dirty( self.x + x0, (self.page << 3) + y0, x1 - x0, y1 - y0 )
+
+    @micropython.viper
+    def _render( self, col0:int, col1:int, page0:int, page1:int ):
+        """ Render a part of the viewport from the map
+        Args
+        col0  (int): First viewport column
+        col1  (int): Column after the last one
+        page0 (int): First viewport page
+        page1 (int): Page after the last one
+        """
+        buf   = ptr8(self.lcd.buffer)
+        tiles = ptr8(self.tiles)
+        tmap  = ptr8(self.map)
+        map_width  = int(self.map_width)
+        map_height = int(self.map_height)
+        scroll_x = int(self.scroll_x)
+        scroll_y = int(self.scroll_y)
+        offset = int(self.page) * LCD_WIDTH + int(self.x)
+
+        for page in range(page0, page1):
+            wy = scroll_y + (page << 3)
+            row = wy >> 3
+            shift = wy & 7
+            upper = row * map_width
+            lower = upper + map_width
+            has_upper = row < map_height
+            has_lower = shift != 0 and row + 1 < map_height
+            out = offset + page * LCD_WIDTH
+            for c in range(col0, col1):
+                wx = scroll_x + c
+                tx = wx >> 3
+                value = 0
+                if tx < map_width:
+                    if has_upper:
+                        value = tiles[(tmap[upper + tx] << 3) + (wx & 7)] >> shift
+                    if has_lower:
+                        value |= tiles[(tmap[lower + tx] << 3) + (wx & 7)] << (8 - shift)
+                buf[out + c] = value
+
+    @micropython.viper
+    def _shift( self, dx:int, dy:int ):
+        """ Move viewport pixels by (-dx, -dy). Uncovered parts are left
+        to be rendered
+        Args
+        dx (int): Map X movement
+        dy (int): Map Y movement
+        """
+        buf = ptr8(self.lcd.buffer)
+        width = int(self.width)
+        pages = int(self.pages)
+        offset = int(self.page) * LCD_WIDTH + int(self.x)
+        dpages = dy >> 3
+        shift = dy & 7
+
+        # Copy in the direction that reads pixels before they are overwritten
+        if dy >= 0:
+            p = 0
+            p_end = pages
+            p_step = 1
+        else:
+            p = pages - 1
+            p_end = -1
+            p_step = -1
+        if dx >= 0:
+            c_start = 0
+            c_end = width
+            c_step = 1
+        else:
+            c_start = width - 1
+            c_end = -1
+            c_step = -1
+
+        while p != p_end:
+            q = p + dpages
+            c = c_start
+            while c != c_end:
+                sc = c + dx
+                if sc >= 0 and sc < width:
+                    value = 0
+                    if q >= 0 and q < pages:
+                        value = buf[offset + q * LCD_WIDTH + sc] >> shift
+                    if shift and q + 1 >= 0 and q + 1 < pages:
+                        value |= buf[offset + (q + 1) * LCD_WIDTH + sc] << (8 - shift)
+                    buf[offset + p * LCD_WIDTH + c] = value
+                c += c_step
+            p += p_step
@@ -0,0 +1,159 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Needs Pillow: pip install pillow
+
+# Converts a sequence of frames to a delta animation for animation.py.
+# The first frame is stored whole, every next frame holds only the runs of
+# page bytes that differ from the previous one, and a last delta leads from
+# the final frame back to the first, so the player can loop without a
+# key frame.
+
+# File layout (integers are little endian):
+# 'LCDA', frame count (u16), frame delay in ms (u16), offset of frame 1 (u32)
+# Then for every frame: run count (u16), and for every run:
+# page (u8), column (u8), length (u8), length bytes of VLSB page data
+
+# Sample usage:
+# anim_to_lcd.py loader.gif loader.lcda
+# anim_to_lcd.py -d 40 -t 100 frame*.png boot.lcda
+
+import argparse
+import struct
+import sys
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:
+    print('anim_to_lcd requires Pillow: pip install pillow')
+    sys.exit(1)
+
+LCD_WIDTH = 192
+LCD_HEIGHT = 64
+LCD_PAGES = LCD_HEIGHT // 8
+MAGIC = b'LCDA'
+HEADER = '<4sHHI'
+# A gap shorter than a run header is cheaper to send than to skip
+MERGE_GAP = 3
+
+def frame_to_vlsb(image, threshold=128, invert=False):
+    """ Convert an image to FrameBuffer page bytes. Dark pixels are set.
+    The image is cropped or padded to the screen from the top left corner
+    """
+    gray = image.convert('L')
+    width = min(gray.width, LCD_WIDTH)
+    height = min(gray.height, LCD_HEIGHT)
+    pixels = gray.load()
+    data = bytearray(LCD_WIDTH * LCD_PAGES)
+    for y in range(height):
+        bit = 1 << (y & 7)
+        offset = (y >> 3) * LCD_WIDTH
+        for x in range(width):
+            if (pixels[x, y] < threshold) != invert:
+                data[offset + x] |= bit
+    return data
+
+def delta_runs(prev, frame):
+    """ Runs of page bytes of frame that differ from prev
+    Return (list): (page, column, bytes) tuples
+    """
+    runs = []
+    for page in range(LCD_PAGES):
+        offset = page * LCD_WIDTH
+        start = None
+        gap = 0
+        for x in range(LCD_WIDTH):
+            if prev is None or prev[offset + x] != frame[offset + x]:
+                if start is None:
+                    start = x
+                gap = 0
+            elif start is not None:
+                gap += 1
+                if gap > MERGE_GAP:
+                    end = x - gap + 1
+                    runs.append((page, start, frame[offset + start:offset + end]))
+                    start = None
+        if start is not None:
+            end = LCD_WIDTH - gap
+            runs.append((page, start, frame[offset + start:offset + end]))
+    return runs
+
+def encode_frame(runs):
+    out = bytearray(struct.pack('<H', len(runs)))
+    for page, x, data in runs:
+        out += bytes((page, x, len(data)))
+        out += data
+    return out
+
+def load_frames(paths, threshold, invert):
+    """ Read frames from image files, animated files add all their frames
+    Return (list, int): Frames and the delay of the first one in ms (or 0)
+    """
+    frames = []
+    delay = 0
+    for path in paths:
+        with Image.open(path) as image:
+            for frame in ImageSequence.Iterator(image):
+                if not delay:
+                    delay = frame.info.get('duration', 0)
+                frames.append(frame_to_vlsb(frame, threshold, invert))
+    return frames, delay
+
+def write_animation(stream, frames, delay):
+    """ Write frames as a delta animation
+    Return (int): Number of bytes written
+    """
+    key = encode_frame(delta_runs(None, frames[0]))
+    header_size = struct.calcsize(HEADER)
+    stream.write(struct.pack(HEADER, MAGIC, len(frames), delay, header_size + len(key)))
+    stream.write(key)
+    size = header_size + len(key)
+    prev = frames[0]
+    for frame in frames[1:] + frames[:1]: # Last delta loops to the first frame
+        data = encode_frame(delta_runs(prev, frame))
+        stream.write(data)
+        size += len(data)
+        prev = frame
+    return size
+
+DESC = """anim_to_lcd.py
+Convert image frames or an animated GIF to a delta animation for the
+LCD19264 player (animation.py). Frames are cropped to 192x64 pixels.
+
+Sample usage:
+anim_to_lcd.py loader.gif loader.lcda
+anim_to_lcd.py -d 40 frame*.png boot.lcda
+"""
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(__file__, description=DESC,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('infiles', type=str, nargs='+', help='Frame images in order')
+    parser.add_argument('outfile', type=str, help='Path and name of output file')
+    parser.add_argument('-d', '--delay', type=int, default=None,
+                        help='Frame delay in ms. Default: GIF frame duration or 0 (as fast as possible)')
+    parser.add_argument('-t', '--threshold', type=int, default=128,
+                        help='Gray level below which a pixel is set. Default 128')
+    parser.add_argument('-i', '--invert', action='store_true',
+                        help='Set light pixels instead of dark ones')
+    args = parser.parse_args()
+
+    try:
+        frames, delay = load_frames(args.infiles, args.threshold, args.invert)
+    except OSError as e:
+        print("Can't read frames", e)
+        sys.exit(1)
+    if args.delay is not None:
+        delay = args.delay
+    if len(frames) > 0xFFFF or not 0 <= delay <= 0xFFFF:
+        print('Too many frames or delay out of range')
+        sys.exit(1)
+
+    try:
+        with open(args.outfile, 'wb') as f:
+            size = write_animation(f, frames, delay)
+    except OSError:
+        print("Can't open", args.outfile, 'for writing')
+        sys.exit(1)
+    full = len(frames) * LCD_WIDTH * LCD_PAGES
+    print('{} frames: {} bytes, {:.1f}% of full frames.'.format(len(frames), size, 100 * size / full))
+    print(args.outfile, 'written successfully.')
@@ -0,0 +1,75 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Needs freetype-py>=1.0
+
+# Compares glyph lookup in font modules emitted by font_to_py.py for large
+# charsets: the multi-range index against the legacy binary searched sparse
+# index. Both modules are generated from the same font and charset, checked
+# for identical glyphs and timed over the whole charset.
+
+# Sample usage:
+# bench_index.py LibreBodoni-Bold.ttf 20
+# bench_index.py -k cyrillic_subset LibreBodoni-Bold.ttf 20
+
+import argparse
+import io
+import os
+import sys
+import time
+
+from font_to_py import Font, write_data
+
+# Default charset: printable ASCII plus Russian/Ukrainian Cyrillic
+CYRILLIC = ''.join(chr(c) for c in range(0x410, 0x450)) + 'ЁёЄєІіЇїҐґ'
+ASCII = ''.join(chr(c) for c in range(32, 127))
+
+def build_module(fnt, font_path, cset, sparse):
+    stream = io.StringIO()
+    write_data(stream, fnt, font_path, True, False, False, cset, sparse=sparse)
+    source = stream.getvalue()
+    module = {}
+    exec(source, module)
+    return module, source
+
+def index_size(module):
+    return sum(len(module[name]) for name in ('_index', '_ranges', '_sparse') if name in module)
+
+def bench(get_ch, text, reps):
+    start = time.perf_counter()
+    for _ in range(reps):
+        for ch in text:
+            get_ch(ch)
+    return (time.perf_counter() - start) * 1e6 / (reps * len(text))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(__file__, description='Benchmark font_to_py.py glyph lookup.')
+    parser.add_argument('infile', type=str, help='Input font file path')
+    parser.add_argument('height', type=int, help='Font height in pixels')
+    parser.add_argument('-k', '--charset_file', type=str, default='',
+                        help='File containing charset (default ASCII and Cyrillic).')
+    parser.add_argument('-n', '--reps', type=int, default=200,
+                        help='Passes over the charset, default %(default)i')
+    args = parser.parse_args()
+
+    if args.charset_file:
+        with open(args.charset_file, 'r', encoding='utf-8') as f:
+            cset = f.read()
+    else:
+        cset = ASCII + CYRILLIC
+    cset = ''.join(sorted({c for c in cset if c.isprintable()} - {'?'}))
+    fnt = Font(args.infile, args.height, 32, 126, False, ord('?'), cset, False)
+    name = os.path.split(args.infile)[1]
+
+    # Lookups include a few characters absent from the font
+    text = cset + '☃中￿'
+    glyphs = None
+    for label, sparse in (('multi-range', False), ('sparse', True)):
+        module, source = build_module(fnt, name, cset, sparse)
+        result = [bytes(g[0]) + bytes((g[1], g[2])) for g in map(module['get_ch'], text)]
+        if glyphs is None:
+            glyphs = result
+        elif result != glyphs:
+            print('ERROR: index formats return different glyphs.')
+            sys.exit(1)
+        usec = bench(module['get_ch'], text, args.reps)
+        print('{:12} index {:6} bytes  {:6.3f} us per get_ch'.format(label, index_size(module), usec))
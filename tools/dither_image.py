@@ -0,0 +1,140 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Needs NumPy and Pillow: pip install numpy pillow
+
+# Dithers images to 1 bit with the same arithmetic as dither.py on the
+# device, so assets can be prepared on a PC and match what the device draws.
+# Ordered dithering is one array operation. Error diffusion is run over
+# anti-diagonals x + 2 * y: every pixel of such a line only gets error from
+# pixels of earlier lines, so a whole line is processed at once.
+
+# Output is a 1-bit image: BMP for LCD19264.load_bmp() or PNG for
+# img_to_assets.py. With -g the gray rows are written raw for
+# Dither.write_stream() on the device instead.
+
+# Sample usage:
+# dither_image.py -m atkinson photo.jpg photo.bmp
+# dither_image.py -W 192 -H 64 -m bayer chart.png chart.png
+# dither_image.py -g -W 192 -H 64 photo.jpg photo.gray
+
+import argparse
+import sys
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print('dither_image requires NumPy and Pillow: pip install numpy pillow')
+    sys.exit(1)
+
+MODES = ('bayer', 'fs', 'atkinson')
+
+# Gray level below which a pixel is set, as in dither.py
+BAYER_4X4 = np.array([[  8, 136,  40, 168],
+                      [200,  72, 232, 104],
+                      [ 56, 184,  24, 152],
+                      [248, 120, 216,  88]], dtype=np.int32)
+
+def bayer(gray):
+    """ Ordered dithering
+    Return (ndarray): True where a pixel is set
+    """
+    height, width = gray.shape
+    matrix = np.tile(BAYER_4X4, ((height + 3) // 4, (width + 3) // 4))[:height, :width]
+    return gray.astype(np.int32) < matrix
+
+def _spread(e, mode):
+    """ Error parts with their (dy, dx) targets """
+    if mode == 'fs':
+        e7 = (e * 7 + 8) >> 4
+        e3 = (e * 3 + 8) >> 4
+        e5 = (e * 5 + 8) >> 4
+        return ((0, 1, e7), (1, -1, e3), (1, 0, e5), (1, 1, e - e7 - e3 - e5))
+    e = (e + 4) >> 3
+    return ((0, 1, e), (0, 2, e), (1, -1, e), (1, 0, e), (1, 1, e), (2, 0, e))
+
+def diffuse(gray, mode):
+    """ Floyd-Steinberg or Atkinson error diffusion
+    Return (ndarray): True where a pixel is set
+    """
+    height, width = gray.shape
+    value = gray.astype(np.int32)
+    out = np.zeros((height, width), dtype=bool)
+    ys, xs = np.mgrid[0:height, 0:width]
+    order = np.argsort((xs + 2 * ys).ravel(), kind='stable')
+    lines = np.cumsum(np.bincount((xs + 2 * ys).ravel()))
+    start = 0
+    for end in lines:
+        index = order[start:end]
+        start = end
+        y = index // width
+        x = index % width
+        v = value[y, x]
+        on = v < 128
+        out[y, x] = on
+        e = np.where(on, v, v - 255)
+        for dy, dx, part in _spread(e, mode):
+            ty = y + dy
+            tx = x + dx
+            keep = (ty < height) & (tx >= 0) & (tx < width)
+            np.add.at(value, (ty[keep], tx[keep]), part[keep])
+    return out
+
+def dither(gray, mode='fs'):
+    """ Dither 8-bit gray pixels (0 - black)
+    Args
+    gray (ndarray): height x width array
+    mode (str): 'bayer', 'fs' or 'atkinson'
+    Return (ndarray): True where a pixel is set (dark)
+    """
+    if mode == 'bayer':
+        return bayer(gray)
+    return diffuse(gray, mode)
+
+def load_gray(path, width=None, height=None):
+    """ Read an image as gray pixels, resized if width or height given """
+    image = Image.open(path).convert('L')
+    if width or height:
+        width = width or image.width * height // image.height
+        height = height or image.height * width // image.width
+        image = image.resize((width, height), Image.LANCZOS)
+    return np.asarray(image)
+
+DESC = """dither_image.py
+Dither an image to 1 bit as dither.py does on the device.
+
+Sample usage:
+dither_image.py -m atkinson photo.jpg photo.bmp
+dither_image.py -g -W 192 -H 64 photo.jpg photo.gray
+"""
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(__file__, description=DESC,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('infile', type=str, help='Input image')
+    parser.add_argument('outfile', type=str, help='Path and name of output file')
+    parser.add_argument('-m', '--mode', choices=MODES, default='fs',
+                        help='Dithering mode. Default fs (Floyd-Steinberg)')
+    parser.add_argument('-W', '--width', type=int, default=None, help='Resize to width')
+    parser.add_argument('-H', '--height', type=int, default=None, help='Resize to height')
+    parser.add_argument('-g', '--gray', action='store_true',
+                        help='Write raw gray rows for Dither.write_stream() instead')
+    args = parser.parse_args()
+
+    try:
+        gray = load_gray(args.infile, args.width, args.height)
+    except OSError:
+        print("Can't open", args.infile)
+        sys.exit(1)
+
+    try:
+        if args.gray:
+            with open(args.outfile, 'wb') as f:
+                f.write(gray.tobytes())
+        else:
+            Image.fromarray(~dither(gray, args.mode)).convert('1').save(args.outfile)
+    except OSError:
+        print("Can't open", args.outfile, 'for writing')
+        sys.exit(1)
+    print('{}x{} pixels.'.format(gray.shape[1], gray.shape[0]))
+    print(args.outfile, 'written successfully.')
@@ -32,6 +32,10 @@
 # THE SOFTWARE.
 
 import argparse
+import ast
+import hashlib
+import multiprocessing
+import pickle
 import sys
 import os
 try:
@@ -44,6 +48,12 @@ if freetype.version()[0] < 1:
     
 MINCHAR = 32  # Ordinal values of default printable ASCII set
 MAXCHAR = 126  # 94 chars
+# Large charsets are indexed as ranges of ordinal values. Ranges separated by
+# this many undefined characters or fewer are merged: each gap entry costs 2
+# bytes of index whereas a range costs 6 bytes and a step of the lookup loop.
+RANGE_GAP = 4
+# Default directory for --cache
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'font_to_py')
 
 # UTILITIES FOR WRITING PYTHON SOURCECODE TO A FILE
 
@@ -96,6 +106,33 @@ class ByteWriter:
 def var_write(stream, name, value):
     stream.write('{} = {}\n'.format(name, value))
 
+# PackBits run-length encoding of a glyph's byte stream.
+# Header byte h: 0..127 -> h + 1 literal bytes follow
+#                129..255 -> next byte is repeated 257 - h times
+# Bold fonts are dominated by runs of 0x00 and 0xff which this packs well.
+def packbits(data):
+    out = bytearray()
+    n = len(data)
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and j - i < 128 and data[j] == data[i]:
+            j += 1
+        if j - i >= 2:  # Repeat run
+            out += bytes((257 - (j - i), data[i]))
+            i = j
+            continue
+        # Literal run: stop where a run of 3 or more identical bytes starts
+        j = i + 1
+        while j < n and j - i < 128:
+            if j + 2 < n and data[j] == data[j + 1] == data[j + 2]:
+                break
+            j += 1
+        out.append(j - i - 1)
+        out += data[i:j]
+        i = j
+    return out
+
 # FONT HANDLING
 
 
@@ -258,6 +295,63 @@ class Glyph:
         return data
 
 
+# GLYPH RENDERING
+# Glyphs are passed around as tuples of Glyph constructor arguments so that
+# they can be pickled: by worker processes and by the disk cache.
+
+GLYPH_FLAGS = freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_MONO
+
+def render_glyph(face, char):
+    assert char != ''
+    face.load_char(char, GLYPH_FLAGS)
+    slot = face.glyph
+    return (bytes(Glyph.unpack_mono_bitmap(slot.bitmap)), slot.bitmap.width,
+            slot.bitmap.rows, slot.bitmap_top, slot.bitmap_left, slot.advance.x / 64)
+
+# Worker processes open their own Face: freetype objects can't be pickled.
+_worker_face = None
+
+def _init_worker(filename):
+    global _worker_face
+    _worker_face = freetype.Face(filename)
+
+def _render_batch(job):
+    pixel_size, chars = job
+    if pixel_size:
+        _worker_face.set_pixel_sizes(0, pixel_size)
+    return [render_glyph(_worker_face, char) for char in chars]
+
+# Rendered glyphs on disk, one file per font file hash, pixel size and load
+# flags. Regenerating a font at another size or with another charset only
+# renders glyphs not rendered before.
+class GlyphCache:
+    def __init__(self, directory, filename):
+        with open(filename, 'rb') as f:
+            self.digest = hashlib.sha1(f.read()).hexdigest()
+        self.directory = directory
+        self._sizes = {}
+
+    def _path(self, pixel_size):
+        name = '{}-{}-{:x}.pickle'.format(self.digest, pixel_size, GLYPH_FLAGS)
+        return os.path.join(self.directory, name)
+
+    def load(self, pixel_size):
+        if pixel_size not in self._sizes:
+            try:
+                with open(self._path(pixel_size), 'rb') as f:
+                    self._sizes[pixel_size] = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                self._sizes[pixel_size] = {}
+        return self._sizes[pixel_size]
+
+    def save(self, pixel_size):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(pixel_size)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(self._sizes[pixel_size], f)
+        os.replace(path + '.tmp', path)
+
+
 # A Font object is a dictionary of ASCII chars indexed by a character e.g.
 # myfont['a']
 # Each entry comprises a list
@@ -267,9 +361,15 @@ class Glyph:
 # height (in pixels) of all characters
 # width (in pixels) for monospaced output (advance width of widest char)
 class Font(dict):
-    def __init__(self, filename, size, minchar, maxchar, monospaced, defchar, charset, bitmapped):
+    def __init__(self, filename, size, minchar, maxchar, monospaced, defchar, charset, bitmapped,
+                 jobs=1, cache=None):
         super().__init__()
         self._face = freetype.Face(filename)
+        self._filename = filename
+        self._jobs = jobs
+        self._pool = None
+        self._cache = GlyphCache(cache, filename) if cache else None
+        self._pixel_size = 0  # 0: bitmapped font at its only size
         # .crange is the inclusive range of ordinal values spanning the character set.
         self.crange = range(minchar, maxchar + 1)
         self.monospaced = monospaced
@@ -290,9 +390,15 @@ class Font(dict):
             self.charset = [chr(defchar)] + cs
         # Populate self with defined chars only
         self.update(dict.fromkeys([c for c in self.charset if c]))
-        self.max_width = self.bmp_dimensions(size) if bitmapped else self.get_dimensions(size)
-        self.width = self.max_width if monospaced else 0
-        self._assign_values()  # Assign values to existing keys
+        try:
+            self.max_width = self.bmp_dimensions(size) if bitmapped else self.get_dimensions(size)
+            self.width = self.max_width if monospaced else 0
+            self._assign_values()  # Assign values to existing keys
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
 
     def bmp_dimensions(self, height):
         max_descent = 0
@@ -300,8 +406,7 @@ class Font(dict):
         # and update the overall dimensions of the resulting bitmap.
         max_width = 0
         max_ascent = 0
-        for char in self.keys():
-            glyph = self._glyph_for_character(char)
+        for char, glyph in self._glyphs():
             max_ascent = max(max_ascent, glyph.ascent)
             max_descent = max(max_descent, glyph.descent)
             # for a few chars e.g. _ glyph.width > glyph.advance_width
@@ -325,14 +430,14 @@ class Font(dict):
         for npass in range(10):
             height += error
             self._face.set_pixel_sizes(0, height)
+            self._pixel_size = height
             max_descent = 0
 
             # For each character in the charset string we get the glyph
             # and update the overall dimensions of the resulting bitmap.
             max_width = 0
             max_ascent = 0
-            for char in self.keys():
-                glyph = self._glyph_for_character(char)
+            for char, glyph in self._glyphs():
                 max_ascent = max(max_ascent, glyph.ascent)
                 max_descent = max(max_descent, glyph.descent)
                 # for a few chars e.g. _ glyph.width > glyph.advance_width
@@ -351,17 +456,29 @@ class Font(dict):
         return max_width
 
 
-    def _glyph_for_character(self, char):
-        # Let FreeType load the glyph for the given character and tell it to
-        # render a monochromatic bitmap representation.
-        assert char != ''
-        self._face.load_char(char, freetype.FT_LOAD_RENDER |
-                             freetype.FT_LOAD_TARGET_MONO)
-        return Glyph.from_glyphslot(self._face.glyph)
+    # Glyphs of all defined chars at the current pixel size as (char, Glyph)
+    # in key order. Glyphs missing from the disk cache are rendered, in
+    # batches by a process pool if jobs > 1. Pool.map() returns batches in
+    # order so the result doesn't depend on scheduling.
+    def _glyphs(self):
+        chars = list(self.keys())
+        rendered = self._cache.load(self._pixel_size) if self._cache else {}
+        missing = [c for c in chars if c not in rendered]
+        if len(missing) > self._jobs > 1:
+            if self._pool is None:
+                self._pool = multiprocessing.Pool(self._jobs, _init_worker, (self._filename,))
+            n = -(-len(missing) // (self._jobs * 4))  # 4 batches per worker
+            jobs = [(self._pixel_size, missing[i:i + n]) for i in range(0, len(missing), n)]
+            batches = self._pool.map(_render_batch, jobs)
+            rendered.update(zip(missing, (g for batch in batches for g in batch)))
+        else:
+            rendered.update((c, render_glyph(self._face, c)) for c in missing)
+        if missing and self._cache:
+            self._cache.save(self._pixel_size)
+        return [(c, Glyph(*rendered[c])) for c in chars]
 
     def _assign_values(self):
-        for char in self.keys():
-            glyph = self._glyph_for_character(char)
+        for char, glyph in self._glyphs():
             # https://github.com/peterhinch/micropython-font-to-py/issues/21
             # Handle negative glyph.left correctly (capital J), 
             # also glyph.width > advance (capital K and R).
@@ -389,14 +506,26 @@ class Font(dict):
             gen = outbuffer.get_vbyte(reverse)
         yield from gen
 
-    def build_arrays(self, hmap, reverse):
+    # Split the defined characters into ranges of nearly contiguous ordinals.
+    def char_ranges(self):
+        ranges = []
+        for ordv in sorted(ord(c) for c in self.keys()):
+            if ranges and ordv - ranges[-1][1] <= RANGE_GAP + 1:
+                ranges[-1][1] = ordv
+            else:
+                ranges.append([ordv, ordv])
+        return ranges
+
+    def build_arrays(self, hmap, reverse, compress=False, sparse=False):
         data = bytearray()
         index = bytearray()
-        sparse = bytearray()
+        ranges = bytearray()
+        sparse_index = bytearray()
         def append_data(data, char):
             width = self[char][1]
             data += (width).to_bytes(2, byteorder='little')
-            data += bytearray(self.stream_char(char, hmap, reverse))
+            glyph = bytearray(self.stream_char(char, hmap, reverse))
+            data += packbits(glyph) if compress else glyph
 
         # self.charset is contiguous with chars having ordinal values in the
         # inclusive range specified. Where the specified character set has gaps
@@ -412,15 +541,32 @@ class Font(dict):
                     index += (len(data)).to_bytes(2, byteorder='little')  # Start
                     append_data(data, char)
             index += (len(data)).to_bytes(2, byteorder='little')  # End
-        else:
-            # Sparse index. Entries are 4 bytes but only populated if the char
-            # has a defined glyph.
+        elif sparse:
+            # Legacy sparse index, kept for comparison (see bench_index.py).
+            # Entries are 4 bytes but only populated if the char has a
+            # defined glyph.
             append_data(data, self.charset[0])  # data[0] is the default char
             for char in sorted(self.keys()):
-                sparse += ord(char).to_bytes(2, byteorder='little')
-                sparse += (len(data)).to_bytes(2, byteorder='little')  # Start
+                sparse_index += ord(char).to_bytes(2, byteorder='little')
+                sparse_index += (len(data)).to_bytes(2, byteorder='little')  # Start
                 append_data(data, char)
-        return data, index, sparse
+        else:
+            # Multi-range index. Each range is 6 bytes: first and last ordinal
+            # and the number of its first entry in the index. Index entries are
+            # 2 bytes, one per ordinal in the range (-> data[0] for absent glyph)
+            append_data(data, self.charset[0])  # data[0] is the default char
+            for first, last in self.char_ranges():
+                ranges += first.to_bytes(2, byteorder='little')
+                ranges += last.to_bytes(2, byteorder='little')
+                ranges += (len(index) // 2).to_bytes(2, byteorder='little')
+                for ordv in range(first, last + 1):
+                    char = chr(ordv)
+                    if char in self:
+                        index += (len(data)).to_bytes(2, byteorder='little')  # Start
+                        append_data(data, char)
+                    else:
+                        index += bytearray((0, 0))
+        return data, index, ranges, sparse_index
 
     def build_binary_array(self, hmap, reverse, sig):
         data = bytearray((0x3f + sig, 0xe7, self.max_width, self.height))
@@ -453,8 +599,29 @@ def get_ch(ch):
     width = ifb(_mvfont[doff : ])
 """
 
-# Code emiited for large charsets, assumed by build_arrays() to be sparse.
-# Binary search of sorted sparse index.
+# Code emitted for large charsets: a linear scan of a few ranges, each with a
+# direct offset table. Bytes are indexed directly so that lookup allocates
+# nothing.
+STRMR = """_mvfont = memoryview(_font)
+
+def get_ch(ch):
+    oc = ord(ch)
+    doff = 0
+    r = 0
+    while r < {0}:
+        lo = _ranges[r] | (_ranges[r + 1] << 8)
+        if oc < lo:
+            break
+        if oc <= _ranges[r + 2] | (_ranges[r + 3] << 8):
+            i = ((_ranges[r + 4] | (_ranges[r + 5] << 8)) + oc - lo) << 1
+            doff = _index[i] | (_index[i + 1] << 8)
+            break
+        r += 6
+    width = _mvfont[doff] | (_mvfont[doff + 1] << 8)
+"""
+
+# Legacy code emitted for large charsets with a sparse index (see
+# build_arrays()). Binary search of sorted sparse index.
 STRSP = """_mvfont = memoryview(_font)
 _mvsp = memoryview(_sparse)
 ifb = lambda l : l[0] | (l[1] << 8)
@@ -488,6 +655,15 @@ STR02V ="""
  
 """
 
+# Code emitted for compressed fonts. Glyph length is unknown until unpacked
+# so the slice runs to the end of the data: the decoder stops after
+# height * ((width - 1)//8 + 1) bytes (hmap) or width * ((height - 1)//8 + 1)
+# bytes (vmap).
+STR02C ='''
+    return _mvfont[doff + 2:], {0}, width
+
+'''
+
 # Extra code emitted where -i is specified.
 STR03 = '''
 def glyphs():
@@ -500,21 +676,59 @@ def write_func(stream, name, arg):
     stream.write('def {}():\n    return {}\n\n'.format(name, arg))
 
 def write_font(op_path, font_path, height, monospaced, hmap, reverse, minchar,
-               maxchar, defchar, charset, iterate, bitmapped):
+               maxchar, defchar, charset, iterate, bitmapped, compress=False,
+               subset=False, jobs=1, cache=None):
     try:
-        fnt = Font(font_path, height, minchar, maxchar, monospaced, defchar, charset, bitmapped)
+        fnt = Font(font_path, height, minchar, maxchar, monospaced, defchar, charset, bitmapped,
+                   jobs, cache)
     except freetype.ft_errors.FT_Exception:
         print("Can't open", font_path)
         return False
     try:
         with open(op_path, 'w', encoding='utf-8') as stream:
-            write_data(stream, fnt, font_path, hmap, reverse, iterate, charset)
+            write_data(stream, fnt, font_path, hmap, reverse, iterate, charset, compress)
     except OSError:
         print("Can't open", op_path, 'for writing')
         return False
+    if subset:  # Compare with the full minchar..maxchar font
+        full = Font(font_path, height, minchar, maxchar, monospaced, defchar, '', bitmapped,
+                    jobs, cache)
+        size = font_size(fnt, hmap, reverse, compress)
+        full_size = font_size(full, hmap, reverse, compress)
+        print('Subset of {} chars: {} bytes. Full {}-{} font: {} bytes. Saved {} bytes.'.format(
+              len(fnt), size, minchar, maxchar, full_size, full_size - size))
     return True
 
-def write_data(stream, fnt, font_path, hmap, reverse, iterate, charset):
+# Bytes of glyph data and index held by the emitted module
+def font_size(fnt, hmap, reverse, compress=False):
+    return sum(len(a) for a in fnt.build_arrays(hmap, reverse, compress))
+
+# SUBSETTING
+# Collect the characters an application can display: string literals of Python
+# sources (docstrings excepted) and the whole text of any other file, e.g. a
+# string table.
+def scan_charset(paths):
+    chars = set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if os.path.splitext(path)[1].upper() != '.PY':
+            chars.update(text)
+            continue
+        tree = ast.parse(text, path)
+        docstrings = set()
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                body = node.body
+                if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+                    docstrings.add(id(body[0].value))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings:
+                chars.update(node.value)
+    return ''.join(sorted(chars))
+
+def write_data(stream, fnt, font_path, hmap, reverse, iterate, charset, compress=False,
+               sparse=False):
     height = fnt.height  # Actual height, not target height
     minchar = min(fnt.crange)
     maxchar = max(fnt.crange)
@@ -530,15 +744,29 @@ def write_data(stream, fnt, font_path, hmap, reverse, iterate, charset):
     write_func(stream, 'monospaced', fnt.monospaced)
     write_func(stream, 'min_ch', minchar)
     write_func(stream, 'max_ch', maxchar)
+    if compress:
+        write_func(stream, 'compressed', True)
     if iterate:
         stream.write(STR03.format(''.join(sorted(fnt.keys()))))
-    data, index, sparse = fnt.build_arrays(hmap, reverse)
+    data, index, ranges, sparse_index = fnt.build_arrays(hmap, reverse, compress, sparse)
+    if compress:
+        raw = fnt.build_arrays(hmap, reverse, False, sparse)[0]
+        st = 'Glyph data compressed from {} to {} bytes ({:.1f}% saving).'
+        print(st.format(len(raw), len(data), 100 * (len(raw) - len(data)) / len(raw)))
     bw_font = ByteWriter(stream, '_font')
     bw_font.odata(data)
     bw_font.eot()
-    if sparse:  # build_arrays() has returned a sparse index
+    if ranges:  # build_arrays() has returned a multi-range index
+        bw_ranges = ByteWriter(stream, '_ranges')
+        bw_ranges.odata(ranges)
+        bw_ranges.eot()
+        bw_index = ByteWriter(stream, '_index')
+        bw_index.odata(index)
+        bw_index.eot()
+        stream.write(STRMR.format(len(ranges)))
+    elif sparse_index:  # build_arrays() has returned a sparse index
         bw_sparse = ByteWriter(stream, '_sparse')
-        bw_sparse.odata(sparse)
+        bw_sparse.odata(sparse_index)
         bw_sparse.eot()
         stream.write(STRSP)
     else:
@@ -546,7 +774,9 @@ def write_data(stream, fnt, font_path, hmap, reverse, iterate, charset):
         bw_index.odata(index)
         bw_index.eot()
         stream.write(STR02.format(minchar, maxchar))
-    if hmap:
+    if compress:
+        stream.write(STR02C.format(height))
+    elif hmap:
         stream.write(STR02H.format(height))
     else:
         stream.write(STR02V.format(height))
@@ -592,6 +822,17 @@ Illegal characters will be rendered as "?".
 
 To specify monospaced rendering issue:
 font_to_py.py FreeSans.ttf 23 --fixed freesans.py
+
+To store glyphs PackBits compressed (decoded by LCD19264.draw_text) issue:
+font_to_py.py -x FreeSans.ttf 23 --compress freesans.py
+
+Large charsets render faster in parallel, and regenerating other sizes or
+charsets is incremental with a glyph cache:
+font_to_py.py -x NotoSansCJK.otf 16 -k cjk_chars --jobs 8 --cache cjk16.py
+
+To build the smallest font holding only the characters of an application's
+string literals, plus digits formatted at runtime, issue:
+font_to_py.py -x FreeSans.ttf 23 --scan main.py screens.py -c 0123456789.- freesans.py
 """
 
 BINARY = """Invalid arguments. Binary (random access) font files support the standard ASCII
@@ -617,6 +858,8 @@ if __name__ == "__main__":
                         help='Produce binary (random access) font file.')
     parser.add_argument('-i', '--iterate', action='store_true',
                         help='Include generator function to iterate over character set.')
+    parser.add_argument('-z', '--compress', action='store_true',
+                        help='PackBits compress glyph data. Requires -x.')
 
     parser.add_argument('-s', '--smallest',
                         type = int,
@@ -643,6 +886,24 @@ if __name__ == "__main__":
                         help = 'File containing charset e.g. cyrillic_subset.',
                         default = '')
 
+    parser.add_argument('-S', '--scan',
+                        type = str,
+                        action = 'append',
+                        help = 'Add characters of string literals in a .py file or text of another file to charset. Repeat for more files.',
+                        default = [])
+
+    parser.add_argument('-j', '--jobs',
+                        type = int,
+                        help = 'Number of processes rendering glyphs, default %(default)i',
+                        default = 1)
+
+    parser.add_argument('--cache',
+                        type = str,
+                        nargs = '?',
+                        const = CACHE_DIR,
+                        help = 'Cache rendered glyphs in a directory, default ' + CACHE_DIR,
+                        default = None)
+
     args = parser.parse_args()
     if not args.outfile[0].isalpha():
         quit('Font filenames must be valid Python variable names.')
@@ -657,9 +918,12 @@ if __name__ == "__main__":
         if os.path.splitext(args.outfile)[1].upper() == '.PY':
             quit('Binary file must not have a .py extension.')
 
-        if args.smallest != 32 or args.largest != 126 or args.errchar != ord('?') or args.charset:
+        if args.smallest != 32 or args.largest != 126 or args.errchar != ord('?') or args.charset or args.scan:
             quit(BINARY)
 
+        if args.compress:
+            quit('Binary font files cannot be compressed.')
+
         print('Writing binary font file.')
         if not write_binary_font(args.outfile, args.infile, args.height,
                                  args.xmap, args.reverse):
@@ -668,6 +932,9 @@ if __name__ == "__main__":
         if not os.path.splitext(args.outfile)[1].upper() == '.PY':
             quit('Output filename must have a .py extension.')
 
+        if args.compress and not args.xmap:
+            quit('Compressed fonts must be horizontally mapped (-x).')
+
         if args.smallest < 0:
             quit('--smallest must be >= 0')
 
@@ -690,6 +957,14 @@ if __name__ == "__main__":
                 sys.exit(1)
         else:
             cset = args.charset
+        if args.scan:
+            try:
+                cset += scan_charset(args.scan)
+            except (OSError, SyntaxError) as e:
+                print("Can't scan", e)
+                sys.exit(1)
+            if not cset.strip():
+                quit('No characters found by --scan.')
         # dedupe and remove default char. Allow chars in private use area.
         # https://github.com/peterhinch/micropython-font-to-py/issues/22
         cs = {c for c in cset if c.isprintable() or (0xE000 <= ord(c) <= 0xF8FF) } - {args.errchar}
@@ -706,7 +981,8 @@ if __name__ == "__main__":
         print('Writing Python font file.')
         if not write_font(args.outfile, args.infile, args.height, args.fixed,
                           args.xmap, args.reverse, args.smallest, args.largest,
-                          args.errchar, cset, args.iterate, bitmapped):
+                          args.errchar, cset, args.iterate, bitmapped, args.compress,
+                          bool(args.scan), max(1, args.jobs), args.cache):
             sys.exit(1)
 
     print(args.outfile, 'written successfully.')
@@ -0,0 +1,140 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Needs Pillow: pip install pillow
+
+# Compiles a folder of images (PNG, BMP, GIF...) to bitmaps in the page
+# layout of the LCD19264 FrameBuffer (MONO_VLSB): for each page of 8 rows,
+# one byte per column, bit 0 at the top. Drawing them needs no conversion.
+
+# Output is either a Python module of (data, height, width) tuples with
+# data as bytes, which stay in flash when the module is frozen, or a binary
+# pack read by assets.py with random access by name.
+
+# Pack layout (integers are little endian):
+# 'LCDP', asset count (u16), then for every asset:
+# name length (u8), name (utf-8), data offset (u32), height (u16), width (u16)
+# followed by the data of all assets
+
+# Sample usage:
+# img_to_assets.py icons/ icons.py
+# img_to_assets.py -b icons/ icons.pack
+
+import argparse
+import os
+import struct
+import sys
+
+try:
+    from PIL import Image
+except ImportError:
+    print('img_to_assets requires Pillow: pip install pillow')
+    sys.exit(1)
+
+MAGIC = b'LCDP'
+EXTENSIONS = ('.png', '.bmp', '.gif', '.jpg', '.jpeg', '.pbm', '.pgm')
+
+def image_to_vlsb(image, threshold=128, invert=False):
+    """ Convert an image to VLSB page bytes. Dark pixels are set
+    Return (bytes, int, int): Data, height, width
+    """
+    gray = image.convert('L')
+    width, height = gray.size
+    pixels = gray.load()
+    data = bytearray(width * ((height + 7) // 8))
+    for y in range(height):
+        bit = 1 << (y & 7)
+        offset = (y >> 3) * width
+        for x in range(width):
+            if (pixels[x, y] < threshold) != invert:
+                data[offset + x] |= bit
+    return bytes(data), height, width
+
+def asset_name(filename):
+    """ Python identifier made from a file name """
+    name = os.path.splitext(os.path.basename(filename))[0]
+    name = ''.join(c if c.isalnum() else '_' for c in name)
+    return '_' + name if name[0].isdigit() else name
+
+def load_assets(folder, threshold, invert):
+    """ Convert all images of a folder, sorted by name
+    Return (list): (name, data, height, width) tuples
+    """
+    assets = []
+    for filename in sorted(os.listdir(folder)):
+        if not filename.lower().endswith(EXTENSIONS):
+            continue
+        with Image.open(os.path.join(folder, filename)) as image:
+            assets.append((asset_name(filename),) + image_to_vlsb(image, threshold, invert))
+    names = [a[0] for a in assets]
+    for name in names:
+        if names.count(name) > 1:
+            raise ValueError('Duplicate asset name ' + name)
+    return assets
+
+def write_module(stream, assets):
+    stream.write('# Code generated by img_to_assets.py.\n')
+    stream.write('# Bitmaps in MONO_VLSB layout: (data, height, width)\n')
+    stream.write('# Draw with LCD19264.draw_vlsb( bitmap, x, y, color )\n\n')
+    for name, data, height, width in assets:
+        lines = ["    b'{}'".format(''.join('\\x{:02x}'.format(b) for b in data[start:start + 16]))
+                 for start in range(0, len(data), 16)]
+        stream.write('{} = (\n{},\n    {}, {} )\n\n'.format(name, '\n'.join(lines), height, width))
+
+def write_pack(stream, assets):
+    index = bytearray(MAGIC + struct.pack('<H', len(assets)))
+    for name, data, height, width in assets:
+        index += struct.pack('<B', len(name.encode())) + name.encode() + bytes(8)
+    offset = len(index)
+    pos = 6
+    for name, data, height, width in assets:
+        pos += 1 + len(name.encode())
+        struct.pack_into('<IHH', index, pos, offset, height, width)
+        pos += 8
+        offset += len(data)
+    stream.write(index)
+    for asset in assets:
+        stream.write(asset[1])
+
+DESC = """img_to_assets.py
+Compile a folder of images to LCD19264 bitmaps in VLSB layout, as a Python
+module of bytes (frozen-friendly) or as a binary pack for assets.py.
+
+Sample usage:
+img_to_assets.py icons/ icons.py
+img_to_assets.py -b icons/ icons.pack
+"""
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(__file__, description=DESC,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('folder', type=str, help='Folder of images')
+    parser.add_argument('outfile', type=str, help='Path and name of output file')
+    parser.add_argument('-b', '--binary', action='store_true',
+                        help='Produce binary pack for assets.py')
+    parser.add_argument('-t', '--threshold', type=int, default=128,
+                        help='Gray level below which a pixel is set. Default 128')
+    parser.add_argument('-i', '--invert', action='store_true',
+                        help='Set light pixels instead of dark ones')
+    args = parser.parse_args()
+
+    try:
+        assets = load_assets(args.folder, args.threshold, args.invert)
+    except (OSError, ValueError) as e:
+        print("Can't convert images", e)
+        sys.exit(1)
+    if not assets:
+        print('No images found in', args.folder)
+        sys.exit(1)
+
+    try:
+        if args.binary:
+            with open(args.outfile, 'wb') as f:
+                write_pack(f, assets)
+        else:
+            with open(args.outfile, 'w') as f:
+                write_module(f, assets)
+    except OSError:
+        print("Can't open", args.outfile, 'for writing')
+        sys.exit(1)
+    print('{} assets, {} bytes of bitmaps.'.format(len(assets), sum(len(a[1]) for a in assets)))
+    print(args.outfile, 'written successfully.')
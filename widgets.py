@@ -0,0 +1,449 @@
+"""
+Retained widgets for the LCD19264 driver (lcd19264.py or lcd19264_rp2.py)
+
+Widgets keep their bounds and state and are redrawn only when their value
+changes. Screen.update() repaints the changed widgets, with the widgets
+they overlap, marks their areas and sends them in one show_dirty(), so
+the cost of a frame follows what changed, not how busy the screen is.
+
+Project path: https://github.com/r2d2-arduino/micropython-lcd19264
+MIT Licenze
+
+Example
+==============================
+screen = Screen( lcd )
+screen.add( Frame( 0, 0, 192, 64, "Boiler" ) )
+temp = screen.add( Value( 8, 14, "{:.1f} C", font = LibreBodoni24 ) )
+level = screen.add( Bar( 8, 44, 176, 10, max_value = 100 ) )
+while True:
+    temp.set( read_temp() )
+    level.set( read_level() )
+    screen.update()
+"""
+from array import array
+
+LCD_WIDTH   = const(192)
+
+class Widget:
+    def __init__( self, x, y, w, h, color = 1 ):
+        """ Widget constructor
+        Args
+        x     (int): Start X position
+        y     (int): Start Y position
+        w     (int): Width
+        h     (int): Height
+        color (int): Color 0 or 1, background is the other color
+        """
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.color = color
+        self.visible = True
+        self._drawn = None # Areas painted on FrameBuffer: (x, y, w, h) list
+        self._dirty = True
+
+    def invalidate( self ):
+        """ Redraw on the next Screen.update() """
+        self._dirty = True
+
+    def set_visible( self, visible = True ):
+        visible = bool( visible )
+        if visible != self.visible:
+            self.visible = visible
+            self._dirty = True
+
+    def move( self, x, y ):
+        if x != self.x or y != self.y:
+            self.x = x
+            self.y = y
+            self._dirty = True
+
+    def areas( self ):
+        """ Return (list): Areas the widget paints now: (x, y, w, h) tuples """
+        return [(self.x, self.y, self.w, self.h)]
+
+    def erase( self, lcd ):
+        """ Clear the areas painted last time """
+        if self._drawn:
+            for x, y, w, h in self._drawn:
+                lcd.fill_rect(x, y, w, h, 1 - self.color)
+                lcd.mark_dirty(x, y, w, h)
+            self._drawn = None
+
+    def draw( self, lcd ):
+        """ Paint the widget and mark its areas """
+        if self.visible:
+            self.render(lcd)
+            self._drawn = self.areas()
+            for area in self._drawn:
+                lcd.mark_dirty(*area)
+        self._dirty = False
+
+    def render( self, lcd ):
+        """ Paint the widget on FrameBuffer, implemented by subclasses """
+        pass
+
+def text_width( text, font ):
+    """ Width of text in pixels, font None - built-in 8x8 font """
+    if font is None:
+        return len(text) * 8
+    width = 0
+    for char in text:
+        width += font.get_ch(char)[2]
+    return width
+
+class Label(Widget):
+    def __init__( self, x, y, text = "", font = None, color = 1, width = None ):
+        """ Label constructor
+        Args
+        x     (int): Start X position
+        y     (int): Start Y position
+        text  (string): Text
+        font  (module): Font module from font_to_py.py, None - built-in 8x8 font
+        color (int): Color 0 or 1
+        width (int): Fixed width, by default the width of the text
+        """
+        self.font = font
+        self.text = text
+        self.fixed_width = width
+        super().__init__(x, y, 0, font.height() if font else 8, color)
+        self._measure()
+
+    def _measure( self ):
+        if self.fixed_width is None:
+            self.w = text_width(self.text, self.font)
+        else:
+            self.w = self.fixed_width
+
+    def set_text( self, text ):
+        """ Change text, redrawn only if it differs """
+        if text != self.text:
+            self.text = text
+            self._measure()
+            self._dirty = True
+
+    def render( self, lcd ):
+        if self.font is None:
+            lcd.text(self.text, self.x, self.y, self.color)
+        else:
+            current_font = lcd._font
+            lcd.set_font(self.font)
+            lcd.draw_text(self.text, self.x, self.y, self.color)
+            lcd.set_font(current_font)
+
+class Value(Label):
+    def __init__( self, x, y, fmt = "{}", value = None, font = None, color = 1, width = None ):
+        """ Formatted value
+        Args
+        fmt   (string): Format, example: "{:.1f} C"
+        value (object): Start value, None - empty
+        Other args as of Label
+        """
+        self.fmt = fmt
+        self.value = value
+        super().__init__(x, y, "" if value is None else fmt.format(value), font, color, width)
+
+    def set( self, value ):
+        """ Change value, formatted and redrawn only if it differs """
+        if value != self.value:
+            self.value = value
+            self.set_text(self.fmt.format(value))
+
+class Bar(Widget):
+    def __init__( self, x, y, w, h, value = 0, max_value = 100, vertical = False, color = 1 ):
+        """ Progress bar
+        Args
+        x, y, w, h (int): Bounds
+        value      (number): Start value, 0..max_value
+        max_value  (number): Value of the full bar
+        vertical   (bool): Fill from the bottom up instead of from the left
+        color      (int): Color 0 or 1
+        """
+        super().__init__(x, y, w, h, color)
+        self.max_value = max_value
+        self.vertical = vertical
+        self.value = value
+        self._fill = self._pixels(value)
+
+    def _pixels( self, value ):
+        """ Filled length inside the border """
+        size = (self.h if self.vertical else self.w) - 4
+        value = max(0, min(value, self.max_value))
+        return int(size * value / self.max_value) if self.max_value else 0
+
+    def set( self, value ):
+        """ Change value, redrawn only if the filled length changes """
+        self.value = value
+        fill = self._pixels(value)
+        if fill != self._fill:
+            self._fill = fill
+            self._dirty = True
+
+    def render( self, lcd ):
+        x, y, w, h = self.x, self.y, self.w, self.h
+        lcd.rect(x, y, w, h, self.color)
+        if self.vertical:
+            lcd.fill_rect(x + 2, y + h - 2 - self._fill, w - 4, self._fill, self.color)
+        else:
+            lcd.fill_rect(x + 2, y + 2, self._fill, h - 4, self.color)
+
+class Icon(Widget):
+    def __init__( self, x, y, bitmap, color = 1 ):
+        """ Bitmap icon
+        Args
+        x      (int): Start X position
+        y      (int): Start Y position
+        bitmap (tuple): Bitmap data, height, width (as in bitmaps.py)
+        color  (int): Color 0 or 1
+        """
+        super().__init__(x, y, bitmap[2], bitmap[1], color)
+        self.bitmap = bitmap
+
+    def set_bitmap( self, bitmap ):
+        """ Change bitmap, redrawn only if it is another one """
+        if bitmap is not self.bitmap:
+            self.bitmap = bitmap
+            self.w = bitmap[2]
+            self.h = bitmap[1]
+            self._dirty = True
+
+    def render( self, lcd ):
+        lcd.draw_bitmap(self.bitmap, self.x, self.y, self.color)
+
+class Frame(Widget):
+    def __init__( self, x, y, w, h, title = None, color = 1 ):
+        """ Border with optional title in the built-in font, drawn under
+        the widgets placed in it
+        Args
+        x, y, w, h (int): Bounds
+        title      (string): Title on the top border
+        color      (int): Color 0 or 1
+        """
+        super().__init__(x, y, w, h, color)
+        self.title = title
+
+    def set_title( self, title ):
+        if title != self.title:
+            self.title = title
+            self._dirty = True
+
+    def areas( self ):
+        """ Only the border and the title, widgets inside are not covered """
+        x, y, w, h = self.x, self.y + 3, self.w, self.h - 3
+        areas = [(x, y, w, 1), (x, y + h - 1, w, 1), (x, y, 1, h), (x + w - 1, y, 1, h)]
+        if self.title:
+            areas.append((x + 4, self.y, len(self.title) * 8 + 4, 8))
+        return areas
+
+    def render( self, lcd ):
+        lcd.rect(self.x, self.y + 3, self.w, self.h - 3, self.color)
+        if self.title:
+            lcd.fill_rect(self.x + 4, self.y, len(self.title) * 8 + 4, 8, 1 - self.color)
+            lcd.text(self.title, self.x + 6, self.y, self.color)
+
+class Chart(Widget):
+    def __init__( self, lcd, x, y, w, h, min_value = 0, max_value = 100, samples = 1, color = 1 ):
+        """ Strip chart of a rolling trace. A new column shifts the plot one
+        column left with byte moves and only the new column is drawn
+        Args
+        lcd       (LCD19264): Display
+        x, y, w, h (int): Bounds, y and h multiples of 8
+        min_value (number): Value at the bottom
+        max_value (number): Value at the top
+        samples   (int): Samples per column, their min and max are plotted
+        color     (int): Color 0 or 1
+        """
+        if (y | h) & 7:
+            raise ValueError( "Chart must be page aligned" )
+        super().__init__(x, y, w, h, color)
+        self.lcd = lcd
+        self.min_value = min_value
+        self.max_value = max_value
+        self.samples = samples
+        # Ring buffer of plotted columns: top and bottom row of the trace
+        self._top = array('B', bytes(w))
+        self._bottom = array('B', bytes(w))
+        self._head = 0   # Ring position of the oldest column
+        self._count = 0  # Columns stored
+        self._last = -1  # Row of the last sample, -1 - none
+        self._acc_top = 0
+        self._acc_bottom = 0
+        self._acc_count = 0
+
+    def _row( self, value ):
+        """ Pixel row of a value, 0 at the top """
+        span = self.max_value - self.min_value
+        row = int((self.max_value - value) * (self.h - 1) / span) if span else 0
+        return max(0, min(row, self.h - 1))
+
+    def add( self, value ):
+        """ Add a sample. Every samples samples a column is plotted; it
+        spans the min and max of the samples and joins the last column
+        """
+        row = self._row(value)
+        if self._acc_count == 0:
+            top = bottom = row if self._last < 0 else self._last
+        else:
+            top = self._acc_top
+            bottom = self._acc_bottom
+        self._acc_top = min(top, row)
+        self._acc_bottom = max(bottom, row)
+        self._acc_count += 1
+        self._last = row
+        if self._acc_count >= self.samples:
+            self._push(self._acc_top, self._acc_bottom)
+            self._acc_count = 0
+
+    def _push( self, top, bottom ):
+        w = self.w
+        if self._count < w:
+            i = (self._head + self._count) % w
+            self._count += 1
+        else:
+            i = self._head
+            self._head = (self._head + 1) % w
+        self._top[i] = top
+        self._bottom[i] = bottom
+        if self._drawn and not self._dirty: # Update on screen at once
+            self._shift()
+            col = min(self.x + w, LCD_WIDTH) - 1 # Right-most column on screen
+            k = col - (self.x + w - self._count)
+            if k >= 0:
+                i = (self._head + k) % w
+                self._column(col, self._top[i], self._bottom[i])
+            else:
+                self._column(col, 1, 0) # Background only
+            self.lcd.mark_dirty(self.x, self.y, w, self.h)
+
+    def clear( self ):
+        """ Forget all samples """
+        self._head = 0
+        self._count = 0
+        self._last = -1
+        self._acc_count = 0
+        self._dirty = True
+
+    def render( self, lcd ):
+        w = self.w
+        lcd.fill_rect(self.x, self.y, w, self.h, 1 - self.color)
+        start = self.x + w - self._count # Newest column at the right edge
+        for k in range(self._count):
+            i = (self._head + k) % w
+            self._column(start + k, self._top[i], self._bottom[i])
+
+    @micropython.viper
+    def _shift( self ):
+        """ Move the plot one column left """
+        buf = ptr8(self.lcd.buffer)
+        x = int(self.x)
+        w = int(self.w)
+        x0 = x
+        if x0 < 0:
+            x0 = 0
+        x1 = x + w - 1
+        if x1 > LCD_WIDTH - 1:
+            x1 = LCD_WIDTH - 1
+        page0 = int(self.y) >> 3
+        for page in range(page0, page0 + (int(self.h) >> 3)):
+            if page < 0 or page >= 8:
+                continue
+            base = page * LCD_WIDTH
+            for col in range(x0, x1):
+                buf[base + col] = buf[base + col + 1]
+
+    @micropython.viper
+    def _column( self, col:int, top:int, bottom:int ):
+        """ Draw one column of the plot: trace from top to bottom row """
+        if col < 0 or col >= LCD_WIDTH:
+            return
+        buf = ptr8(self.lcd.buffer)
+        fill = 0
+        if int(self.color) == 0:
+            fill = 0xFF
+        page0 = int(self.y) >> 3
+        for q in range(int(self.h) >> 3):
+            page = page0 + q
+            if page < 0 or page >= 8:
+                continue
+            value = 0
+            for bit in range(8):
+                row = (q << 3) + bit
+                if row >= top and row <= bottom:
+                    value |= 1 << bit
+            buf[page * LCD_WIDTH + col] = value ^ fill
+
+def _overlap( a, b ):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+class Screen:
+    def __init__( self, lcd ):
+        """ Widgets in drawing order, the first one at the bottom
+        Args
+        lcd (LCD19264): Display
+        """
+        self.lcd = lcd
+        self.widgets = []
+
+    def add( self, widget ):
+        """ Return (Widget): The widget """
+        self.widgets.append(widget)
+        widget._dirty = True
+        return widget
+
+    def remove( self, widget ):
+        """ Remove a widget, its area is cleared on the next update() """
+        widget.set_visible(False)
+        self.update_widgets()
+        self.widgets.remove(widget)
+
+    def update_widgets( self ):
+        """ Repaint changed widgets on FrameBuffer and mark their areas.
+        Widgets overlapping a repainted area are repainted too
+        """
+        widgets = self.widgets
+        redraw = [w._dirty for w in widgets]
+        areas = []
+        for i, w in enumerate(widgets):
+            if redraw[i]:
+                if w._drawn:
+                    areas.extend(w._drawn)
+                if w.visible:
+                    areas.extend(w.areas())
+        # Widgets under or over a repainted area, until no more are found
+        k = 0
+        while k < len(areas):
+            area = areas[k]
+            k += 1
+            for i, w in enumerate(widgets):
+                if not redraw[i] and w._drawn:
+                    for drawn in w._drawn:
+                        if _overlap(area, drawn):
+                            redraw[i] = True
+                            areas.extend(w._drawn)
+                            break
+        if not any(redraw):
+            return False
+        lcd = self.lcd
+        for i in range(len(widgets) - 1, -1, -1): # Top-most first
+            if redraw[i]:
+                widgets[i].erase(lcd)
+        for i, w in enumerate(widgets):
+            if redraw[i]:
+                w.draw(lcd)
+        return True
+
+    def update( self ):
+        """ Repaint changed widgets and send their areas to LCD
+        Return (int): Number of bytes sent
+        """
+        self.update_widgets()
+        return self.lcd.show_dirty() # Also areas widgets marked themselves
+
+    def redraw( self ):
+        """ Repaint everything and send the whole screen """
+        self.lcd.fill(0)
+        for w in self.widgets:
+            w._drawn = None
+            w.draw(self.lcd)
+        self.lcd.show()